@@ -1,14 +1,13 @@
 """Agent orchestrator interface - defines contract for AI agent coordination."""
-from abc import ABC, abstractmethod
-from typing import AsyncIterator
+import asyncio
+from typing import AsyncIterator, Protocol
 
 from src.domain.entities.query_result import QueryResult, StreamEvent
 
 
-class IAgentOrchestrator(ABC):
+class IAgentOrchestrator(Protocol):
     """Interface for AI agent orchestration."""
 
-    @abstractmethod
     async def process_query(self, query: str, user_id: str) -> QueryResult:
         """
         Process a user query through the agent.
@@ -24,10 +23,9 @@ class IAgentOrchestrator(ABC):
             ValueError: If query is invalid
             RuntimeError: If processing fails
         """
-        pass
+        ...
 
-    @abstractmethod
-    async def process_query_stream(
+    def process_query_stream(
         self, query: str, user_id: str
     ) -> AsyncIterator[StreamEvent]:
         """
@@ -44,4 +42,22 @@ class IAgentOrchestrator(ABC):
             ValueError: If query is invalid
             RuntimeError: If processing fails
         """
-        pass
+        ...
+
+    def process_query_partial(
+        self, query: str, user_id: str
+    ) -> tuple[AsyncIterator[StreamEvent], "asyncio.Future[QueryResult]"]:
+        """
+        Process a user query, exposing streaming events and the final result together.
+
+        Args:
+            query: User's natural language query
+            user_id: Unique identifier for the user making the query
+
+        Returns:
+            Tuple of (stream of StreamEvent objects, future resolving to the QueryResult)
+
+        Raises:
+            ValueError: If query is invalid
+        """
+        ...
@@ -1,9 +1,12 @@
 """Use case for retrieving historical stock prices."""
 from datetime import datetime
 
+from src.application.use_cases.symbols import normalize_symbol
 from src.domain.entities.stock_price import HistoricalStockPrice
 from src.domain.interfaces.stock_repository import IStockRepository
 
+VALID_PERIODS = frozenset({"1d", "1wk", "1mo"})
+
 
 class GetHistoricalStockPriceUseCase:
     """Use case for getting historical stock prices."""
@@ -40,9 +43,8 @@ class GetHistoricalStockPriceUseCase:
             ValueError: If inputs are invalid
             RuntimeError: If historical data cannot be retrieved
         """
-        # Validate inputs
-        if not symbol or not isinstance(symbol, str):
-            raise ValueError("Stock symbol must be a non-empty string")
+        # Validate inputs and normalize symbol to uppercase
+        normalized_symbol = normalize_symbol(symbol)
 
         if not isinstance(start_date, datetime):
             raise ValueError("Start date must be a datetime object")
@@ -53,12 +55,9 @@ class GetHistoricalStockPriceUseCase:
         if start_date >= end_date:
             raise ValueError("Start date must be before end date")
 
-        if period not in ["1d", "1wk", "1mo"]:
+        if period not in VALID_PERIODS:
             raise ValueError("Period must be one of: 1d, 1wk, 1mo")
 
-        # Normalize symbol to uppercase
-        normalized_symbol = symbol.strip().upper()
-
         # Delegate to repository
         return await self._stock_repository.get_historical_prices(
             normalized_symbol, start_date, end_date, period
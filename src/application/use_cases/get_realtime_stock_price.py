@@ -1,4 +1,5 @@
 """Use case for retrieving realtime stock price."""
+from src.application.use_cases.symbols import normalize_symbol
 from src.domain.entities.stock_price import StockPrice
 from src.domain.interfaces.stock_repository import IStockRepository
 
@@ -29,12 +30,8 @@ class GetRealtimeStockPriceUseCase:
             ValueError: If symbol is invalid or empty
             RuntimeError: If price data cannot be retrieved
         """
-        # Validate input
-        if not symbol or not isinstance(symbol, str):
-            raise ValueError("Stock symbol must be a non-empty string")
-
-        # Normalize symbol to uppercase
-        normalized_symbol = symbol.strip().upper()
+        # Validate and normalize symbol to uppercase
+        normalized_symbol = normalize_symbol(symbol)
 
         # Delegate to repository
         return await self._stock_repository.get_realtime_price(normalized_symbol)
@@ -1,19 +1,26 @@
 """Use case for querying documents with semantic search."""
 from src.domain.entities.document import DocumentChunk
 from src.domain.interfaces.document_repository import IDocumentRepository
+from src.domain.interfaces.semantic_cache import ISemanticCache
 
 
 class QueryDocumentsUseCase:
     """Use case for querying documents."""
 
-    def __init__(self, document_repository: IDocumentRepository) -> None:
+    def __init__(
+        self,
+        document_repository: IDocumentRepository,
+        semantic_cache: ISemanticCache | None = None,
+    ) -> None:
         """
         Initialize use case with dependencies.
 
         Args:
             document_repository: Document repository implementation
+            semantic_cache: Optional cache for paraphrased repeat queries
         """
         self._document_repository = document_repository
+        self._semantic_cache = semantic_cache
 
     async def execute(self, query: str, max_results: int = 5) -> list[DocumentChunk]:
         """
@@ -43,5 +50,15 @@ class QueryDocumentsUseCase:
         if not normalized_query:
             raise ValueError("Query cannot be empty after normalization")
 
+        if self._semantic_cache is None:
+            return await self._document_repository.search_documents(normalized_query, max_results)
+
+        namespace = f"documents:{max_results}"
+        cached = await self._semantic_cache.get(namespace, normalized_query)
+        if cached is not None:
+            return cached
+
         # Delegate to repository
-        return await self._document_repository.search_documents(normalized_query, max_results)
+        chunks = await self._document_repository.search_documents(normalized_query, max_results)
+        await self._semantic_cache.set(namespace, normalized_query, chunks)
+        return chunks
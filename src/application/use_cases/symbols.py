@@ -0,0 +1,34 @@
+"""Ticker symbol validation and normalization shared by stock use cases."""
+import re
+from functools import lru_cache
+
+# Yahoo Finance ticker shapes: AMZN, BRK-B, BRK.B, 7203.T, ^GSPC, BTC-USD, GC=F
+_TICKER_RE = re.compile(r"\^?[A-Z0-9]{1,10}(?:[.\-=][A-Z0-9]{1,6}){0,2}")
+
+
+@lru_cache(maxsize=512)
+def _normalize(symbol: str) -> str:
+    """Strip, uppercase and format-check a ticker symbol (pure, so safe to memoize)."""
+    normalized = symbol.strip().upper()
+    if not _TICKER_RE.fullmatch(normalized):
+        raise ValueError(f"Invalid stock symbol format: {symbol!r}")
+    return normalized
+
+
+def normalize_symbol(symbol: str) -> str:
+    """
+    Validate and normalize a ticker symbol.
+
+    Args:
+        symbol: Raw ticker symbol (e.g., " amzn ")
+
+    Returns:
+        Normalized uppercase symbol (e.g., "AMZN")
+
+    Raises:
+        ValueError: If symbol is not a non-empty string or is not a valid ticker format
+    """
+    # Type check stays ahead of the cache: unhashable input would raise TypeError there
+    if not symbol or not isinstance(symbol, str):
+        raise ValueError("Stock symbol must be a non-empty string")
+    return _normalize(symbol)
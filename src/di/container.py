@@ -1,138 +1,170 @@
 """Dependency Injection Container for Clean Architecture."""
-import os
-from typing import TYPE_CHECKING
+import threading
 from functools import lru_cache
 
+import boto3
+
+from src.application.interfaces.agent_orchestrator import IAgentOrchestrator
+from src.application.use_cases.get_historical_stock_price import (
+    GetHistoricalStockPriceUseCase,
+)
+from src.application.use_cases.get_realtime_stock_price import (
+    GetRealtimeStockPriceUseCase,
+)
+from src.application.use_cases.query_documents import QueryDocumentsUseCase
+from src.di.settings import Settings
+from src.domain.interfaces.document_repository import IDocumentRepository
+from src.domain.interfaces.llm_service import ILLMService
+from src.domain.interfaces.observability_service import IObservabilityService
+from src.domain.interfaces.stock_repository import IStockRepository
+from src.infrastructure.agent.flash_queries import FlashQueryRegistry
+from src.infrastructure.agent.langgraph_orchestrator import LangGraphOrchestrator
+from src.infrastructure.agent.tools import AgentTools
+from src.infrastructure.aws.cognito_auth import CognitoAuthService
+from src.infrastructure.cache.semantic_cache import InMemorySemanticCache
 from src.infrastructure.logging import get_logger
+from src.infrastructure.repositories.bedrock_document_repository import (
+    BedrockDocumentRepository,
+)
+from src.infrastructure.repositories.cached_stock_repository import CachedStockRepository
+from src.infrastructure.repositories.coalescing_document_repository import (
+    CoalescingDocumentRepository,
+)
+from src.infrastructure.repositories.yfinance_stock_repository import (
+    YFinanceStockRepository,
+)
+from src.infrastructure.services.bedrock_llm_service import (
+    EMBEDDING_MODEL_ID,
+    BedrockLLMService,
+)
+from src.infrastructure.services.cached_llm_service import CachedLLMService
+from src.infrastructure.services.langfuse_observability import (
+    LangfuseObservabilityService,
+)
+from src.infrastructure.services.langsmith_observability import (
+    LangSmithObservabilityService,
+)
 
 logger = get_logger(__name__)
 
-if TYPE_CHECKING:
-    from src.application.interfaces.agent_orchestrator import IAgentOrchestrator
-    from src.application.use_cases.get_historical_stock_price import (
-        GetHistoricalStockPriceUseCase,
-    )
-    from src.application.use_cases.get_realtime_stock_price import (
-        GetRealtimeStockPriceUseCase,
-    )
-    from src.application.use_cases.query_documents import QueryDocumentsUseCase
-    from src.domain.interfaces.document_repository import IDocumentRepository
-    from src.domain.interfaces.observability_service import IObservabilityService
-    from src.domain.interfaces.stock_repository import IStockRepository
-    from src.infrastructure.agent.langgraph_orchestrator import LangGraphOrchestrator
-    from src.infrastructure.agent.tools import AgentTools
-    from src.infrastructure.aws.cognito_auth import CognitoAuthService
-    from src.infrastructure.repositories.bedrock_document_repository import (
-        BedrockDocumentRepository,
-    )
-    from src.infrastructure.repositories.yfinance_stock_repository import (
-        YFinanceStockRepository,
-    )
-    from src.infrastructure.services.langfuse_observability import (
-        LangfuseObservabilityService,
-    )
-    from src.infrastructure.services.langsmith_observability import (
-        LangSmithObservabilityService,
-    )
-
 
 class DIContainer:
     """Dependency Injection Container - wires all layers together."""
 
-    def __init__(self) -> None:
-        """Initialize container with environment configuration."""
-        logger.info("Initializing DI container")
-
-        # AWS Configuration
-        self.aws_region = os.getenv("AWS_REGION", "us-east-2")
-        self.bedrock_region = os.getenv("BEDROCK_REGION", self.aws_region)
-        # Allow LLM runtime to live in a different Bedrock region than other AWS resources
-        self.bedrock_llm_region = os.getenv(
-            "BEDROCK_LLM_REGION", self.bedrock_region
-        )
-        self.bedrock_model_id = os.getenv(
-            "BEDROCK_MODEL_ID", "us.anthropic.claude-3-5-sonnet-20241022-v2:0"
-        )
-        self.bedrock_knowledge_base_id = os.getenv("BEDROCK_KNOWLEDGE_BASE_ID", "")
-
-        # Cognito Configuration
-        self.cognito_user_pool_id = os.getenv("COGNITO_USER_POOL_ID", "")
-        self.cognito_app_client_id = os.getenv("COGNITO_APP_CLIENT_ID", "")
-
-        # Observability Configuration
-        self.observability_provider = os.getenv("OBSERVABILITY_PROVIDER", "langfuse")  # langfuse or langsmith
+    def __init__(self, settings: Settings | None = None, eager_init: bool = True) -> None:
+        """
+        Initialize container with application configuration.
 
-        # Langfuse Configuration
-        self.langfuse_public_key = os.getenv("LANGFUSE_PUBLIC_KEY", "")
-        self.langfuse_secret_key = os.getenv("LANGFUSE_SECRET_KEY", "")
-        self.langfuse_host = os.getenv("LANGFUSE_HOST", "https://cloud.langfuse.com")
+        Args:
+            settings: Application settings (defaults to Settings.from_env())
+            eager_init: Build configured AWS-backed singletons now rather than on the
+                first request, moving boto3 client creation out of request latency
+        """
+        logger.info("Initializing DI container")
 
-        # LangSmith Configuration
-        self.langsmith_api_key = os.getenv("LANGSMITH_API_KEY", "")
-        self.langsmith_project = os.getenv("LANGSMITH_PROJECT", "aws-ai-agent")
-        self.langsmith_endpoint = os.getenv("LANGSMITH_ENDPOINT", "https://api.smith.langchain.com")
+        self.settings = settings if settings is not None else Settings.from_env()
 
-        # Initialize singletons
+        # Initialize singletons. Construction is guarded by a re-entrant lock because
+        # sync FastAPI dependencies run on a thread pool and singletons build each other.
+        self._lock = threading.RLock()
         self._stock_repository = None
         self._document_repository = None
         self._observability_service = None
+        self._llm_service = None
+        self._semantic_cache = None
         self._cognito_service = None
+        self._realtime_stock_price_use_case = None
+        self._historical_stock_price_use_case = None
+        self._query_documents_use_case = None
+        self._agent_tools = None
         self._agent_orchestrator = None
 
+        # One session shares credential resolution and loaded service models across clients
+        self._boto_session = boto3.Session()
+
         logger.info(
             "DI container initialized",
             extra={
-                "aws_region": self.aws_region,
-                "bedrock_model_id": self.bedrock_model_id,
-                "bedrock_region": self.bedrock_region,
-                "bedrock_llm_region": self.bedrock_llm_region,
-                "observability_provider": self.observability_provider,
-                "kb_id_configured": bool(self.bedrock_knowledge_base_id),
-                "cognito_configured": bool(self.cognito_user_pool_id and self.cognito_app_client_id),
+                "aws_region": self.settings.aws_region,
+                "bedrock_model_id": self.settings.bedrock_model_id,
+                "bedrock_region": self.settings.bedrock_region,
+                "bedrock_llm_region": self.settings.bedrock_llm_region,
+                "bedrock_performance_mode": self.settings.bedrock_performance_mode,
+                "observability_provider": self.settings.observability_provider,
+                "semantic_cache_enabled": self.settings.semantic_cache_enabled,
+                "flash_queries_enabled": self.settings.flash_queries_enabled,
+                "kb_id_configured": bool(self.settings.bedrock_knowledge_base_id),
+                "cognito_configured": self.settings.cognito_configured,
             },
         )
 
+        if eager_init:
+            self._warm_up()
+
+    def _warm_up(self) -> None:
+        """Create configured AWS clients up front; unconfigured services stay lazy."""
+        if self.settings.bedrock_knowledge_base_id:
+            try:
+                self.document_repository
+            except Exception as e:
+                logger.warning("Document repository warm-up failed", extra={"error": str(e)})
+
+        if self.settings.cognito_configured:
+            try:
+                self.cognito_service
+            except Exception as e:
+                logger.warning("Cognito service warm-up failed", extra={"error": str(e)})
+
     # Repositories
     @property
-    def stock_repository(self):
+    def stock_repository(self) -> IStockRepository:
         """Get stock repository instance."""
         if self._stock_repository is None:
-            from src.infrastructure.repositories.yfinance_stock_repository import (
-                YFinanceStockRepository,
-            )
-
-            logger.info("Creating YFinance stock repository")
-            self._stock_repository = YFinanceStockRepository()
+            with self._lock:
+                if self._stock_repository is None:
+                    logger.info("Creating YFinance stock repository")
+                    repository = YFinanceStockRepository(
+                        max_concurrency=self.settings.yfinance_max_concurrency
+                    )
+                    # Repeated quotes for a symbol within the TTL skip Yahoo entirely
+                    ttl = self.settings.realtime_price_cache_ttl_seconds
+                    self._stock_repository = (
+                        CachedStockRepository(repository, ttl_seconds=ttl) if ttl > 0 else repository
+                    )
         return self._stock_repository
 
     @property
-    def document_repository(self):
+    def document_repository(self) -> IDocumentRepository:
         """Get document repository instance."""
         if self._document_repository is None:
-            if not self.bedrock_knowledge_base_id:
-                logger.error("BEDROCK_KNOWLEDGE_BASE_ID environment variable not set")
-                raise ValueError("BEDROCK_KNOWLEDGE_BASE_ID environment variable not set")
-
-            from src.infrastructure.repositories.bedrock_document_repository import (
-                BedrockDocumentRepository,
-            )
-
-            logger.info(
-                "Creating Bedrock document repository",
-                extra={
-                    "knowledge_base_id": self.bedrock_knowledge_base_id,
-                    "region": self.bedrock_region,
-                },
-            )
-            self._document_repository = BedrockDocumentRepository(
-                knowledge_base_id=self.bedrock_knowledge_base_id,
-                region=self.bedrock_region,
-            )
+            with self._lock:
+                if self._document_repository is None:
+                    if not self.settings.bedrock_knowledge_base_id:
+                        logger.error("BEDROCK_KNOWLEDGE_BASE_ID environment variable not set")
+                        raise ValueError("BEDROCK_KNOWLEDGE_BASE_ID environment variable not set")
+
+                    logger.info(
+                        "Creating Bedrock document repository",
+                        extra={
+                            "knowledge_base_id": self.settings.bedrock_knowledge_base_id,
+                            "region": self.settings.bedrock_region,
+                        },
+                    )
+                    # Concurrent identical searches share a single Knowledge Base call,
+                    # and recent results are reused until they expire
+                    self._document_repository = CoalescingDocumentRepository(
+                        BedrockDocumentRepository(
+                            knowledge_base_id=self.settings.bedrock_knowledge_base_id,
+                            region=self.settings.bedrock_region,
+                            session=self._boto_session,
+                        ),
+                        result_ttl_seconds=self.settings.document_search_cache_ttl_seconds,
+                    )
         return self._document_repository
 
     # Services
     @property
-    def observability_service(self):
+    def observability_service(self) -> IObservabilityService | None:
         """
         Get observability service instance based on configuration.
 
@@ -140,127 +172,203 @@ class DIContainer:
         Returns None if observability is not configured.
         """
         if self._observability_service is None:
-            if self.observability_provider == "langsmith":
-                # Use LangSmith
-                if self.langsmith_api_key:
-                    from src.infrastructure.services.langsmith_observability import (
-                        LangSmithObservabilityService,
-                    )
+            with self._lock:
+                if self._observability_service is None:
+                    if self.settings.observability_provider == "langsmith":
+                        # Use LangSmith
+                        if self.settings.langsmith_api_key:
+                            logger.info("Creating LangSmith observability service")
+                            self._observability_service = LangSmithObservabilityService(
+                                api_key=self.settings.langsmith_api_key,
+                                project_name=self.settings.langsmith_project,
+                                endpoint=self.settings.langsmith_endpoint,
+                            )
+                        else:
+                            logger.warning("LangSmith selected but API key not configured")
+                    elif self.settings.observability_provider == "langfuse":
+                        # Use Langfuse (default)
+                        if self.settings.langfuse_public_key and self.settings.langfuse_secret_key:
+                            logger.info("Creating Langfuse observability service")
+                            self._observability_service = LangfuseObservabilityService(
+                                public_key=self.settings.langfuse_public_key,
+                                secret_key=self.settings.langfuse_secret_key,
+                                host=self.settings.langfuse_host,
+                            )
+                        else:
+                            logger.warning("Langfuse selected but keys not configured")
+                    else:
+                        logger.info("No observability provider configured")
+                    # Return None if not configured (observability is optional)
+        return self._observability_service
 
-                    logger.info("Creating LangSmith observability service")
-                    self._observability_service = LangSmithObservabilityService(
-                        api_key=self.langsmith_api_key,
-                        project_name=self.langsmith_project,
-                        endpoint=self.langsmith_endpoint,
+    @property
+    def llm_service(self) -> ILLMService:
+        """Get Bedrock LLM service instance (used for embeddings)."""
+        if self._llm_service is None:
+            with self._lock:
+                if self._llm_service is None:
+                    logger.info(
+                        "Creating Bedrock LLM service",
+                        extra={"region": self.settings.bedrock_region},
                     )
-                else:
-                    logger.warning("LangSmith selected but API key not configured")
-            elif self.observability_provider == "langfuse":
-                # Use Langfuse (default)
-                if self.langfuse_public_key and self.langfuse_secret_key:
-                    from src.infrastructure.services.langfuse_observability import (
-                        LangfuseObservabilityService,
+                    # Repeated texts (cache lookups, re-asked queries) skip the Titan call
+                    self._llm_service = CachedLLMService(
+                        BedrockLLMService(
+                            model_id=self.settings.bedrock_model_id,
+                            region=self.settings.bedrock_region,
+                            session=self._boto_session,
+                        ),
+                        embedding_model_id=EMBEDDING_MODEL_ID,
+                        max_entries=self.settings.embedding_cache_max_entries,
                     )
+        return self._llm_service
 
-                    logger.info("Creating Langfuse observability service")
-                    self._observability_service = LangfuseObservabilityService(
-                        public_key=self.langfuse_public_key,
-                        secret_key=self.langfuse_secret_key,
-                        host=self.langfuse_host,
+    @property
+    def semantic_cache(self) -> InMemorySemanticCache | None:
+        """
+        Get semantic cache instance.
+
+        Returns None if the cache is disabled via SEMANTIC_CACHE_ENABLED.
+        """
+        if self._semantic_cache is None and self.settings.semantic_cache_enabled:
+            with self._lock:
+                if self._semantic_cache is None and self.settings.semantic_cache_enabled:
+                    logger.info(
+                        "Creating semantic cache",
+                        extra={
+                            "similarity_threshold": self.settings.semantic_cache_threshold,
+                            "max_entries": self.settings.semantic_cache_max_entries,
+                        },
                     )
-                else:
-                    logger.warning("Langfuse selected but keys not configured")
-            else:
-                logger.info("No observability provider configured")
-            # Return None if not configured (observability is optional)
-        return self._observability_service
+                    self._semantic_cache = InMemorySemanticCache(
+                        llm_service=self.llm_service,
+                        max_entries=self.settings.semantic_cache_max_entries,
+                        ttl_seconds=self.settings.semantic_cache_ttl_seconds,
+                        similarity_threshold=self.settings.semantic_cache_threshold,
+                    )
+        return self._semantic_cache
 
     @property
-    def cognito_service(self):
+    def cognito_service(self) -> CognitoAuthService:
         """Get Cognito authentication service instance."""
         if self._cognito_service is None:
-            if not self.cognito_user_pool_id or not self.cognito_app_client_id:
-                logger.error("Cognito environment variables not set")
-                raise ValueError("Cognito environment variables not set")
-
-            from src.infrastructure.aws.cognito_auth import CognitoAuthService
-
-            logger.info("Creating Cognito authentication service")
-            self._cognito_service = CognitoAuthService(
-                user_pool_id=self.cognito_user_pool_id,
-                app_client_id=self.cognito_app_client_id,
-                region=self.aws_region,
-            )
+            with self._lock:
+                if self._cognito_service is None:
+                    if not self.settings.cognito_configured:
+                        logger.error("Cognito environment variables not set")
+                        raise ValueError("Cognito environment variables not set")
+
+                    logger.info("Creating Cognito authentication service")
+                    self._cognito_service = CognitoAuthService(
+                        user_pool_id=self.settings.cognito_user_pool_id,
+                        app_client_id=self.settings.cognito_app_client_id,
+                        region=self.settings.aws_region,
+                        session=self._boto_session,
+                    )
         return self._cognito_service
 
     # Use Cases
-    def get_realtime_stock_price_use_case(self):
+    def get_realtime_stock_price_use_case(self) -> GetRealtimeStockPriceUseCase:
         """Get realtime stock price use case."""
-        from src.application.use_cases.get_realtime_stock_price import (
-            GetRealtimeStockPriceUseCase,
-        )
-
-        return GetRealtimeStockPriceUseCase(stock_repository=self.stock_repository)
+        if self._realtime_stock_price_use_case is None:
+            with self._lock:
+                if self._realtime_stock_price_use_case is None:
+                    self._realtime_stock_price_use_case = GetRealtimeStockPriceUseCase(
+                        stock_repository=self.stock_repository
+                    )
+        return self._realtime_stock_price_use_case
 
-    def get_historical_stock_price_use_case(self):
+    def get_historical_stock_price_use_case(self) -> GetHistoricalStockPriceUseCase:
         """Get historical stock price use case."""
-        from src.application.use_cases.get_historical_stock_price import (
-            GetHistoricalStockPriceUseCase,
-        )
-
-        return GetHistoricalStockPriceUseCase(stock_repository=self.stock_repository)
+        if self._historical_stock_price_use_case is None:
+            with self._lock:
+                if self._historical_stock_price_use_case is None:
+                    self._historical_stock_price_use_case = GetHistoricalStockPriceUseCase(
+                        stock_repository=self.stock_repository
+                    )
+        return self._historical_stock_price_use_case
 
-    def query_documents_use_case(self):
+    def query_documents_use_case(self) -> QueryDocumentsUseCase:
         """Get query documents use case."""
-        from src.application.use_cases.query_documents import QueryDocumentsUseCase
-
-        return QueryDocumentsUseCase(document_repository=self.document_repository)
+        if self._query_documents_use_case is None:
+            with self._lock:
+                if self._query_documents_use_case is None:
+                    self._query_documents_use_case = QueryDocumentsUseCase(
+                        document_repository=self.document_repository,
+                        semantic_cache=self.semantic_cache,
+                    )
+        return self._query_documents_use_case
 
     # Agent
-    def create_agent_tools(self):
-        """Create agent tools with use cases."""
-        from src.infrastructure.agent.tools import AgentTools
-
-        return AgentTools(
-            get_realtime_price_uc=self.get_realtime_stock_price_use_case(),
-            get_historical_price_uc=self.get_historical_stock_price_use_case(),
-            query_documents_uc=self.query_documents_use_case(),
-        )
+    def create_agent_tools(self) -> AgentTools:
+        """Get agent tools wired with the use case singletons."""
+        if self._agent_tools is None:
+            with self._lock:
+                if self._agent_tools is None:
+                    self._agent_tools = AgentTools(
+                        get_realtime_price_uc=self.get_realtime_stock_price_use_case(),
+                        get_historical_price_uc=self.get_historical_stock_price_use_case(),
+                        query_documents_uc=self.query_documents_use_case(),
+                    )
+        return self._agent_tools
 
     @property
-    def agent_orchestrator(self):
+    def agent_orchestrator(self) -> IAgentOrchestrator:
         """Get agent orchestrator instance."""
         if self._agent_orchestrator is None:
-            from src.infrastructure.agent.langgraph_orchestrator import LangGraphOrchestrator
-
-            logger.info(
-                "Creating LangGraph agent orchestrator",
-                extra={
-                    "model_id": self.bedrock_model_id,
-                    "region": self.bedrock_llm_region,
-                },
-            )
-            self._agent_orchestrator = LangGraphOrchestrator(
-                llm_model_id=self.bedrock_model_id,
-                region=self.bedrock_llm_region,
-                agent_tools=self.create_agent_tools(),
-                observability_service=self.observability_service,
-            )
+            with self._lock:
+                if self._agent_orchestrator is None:
+                    logger.info(
+                        "Creating LangGraph agent orchestrator",
+                        extra={
+                            "model_id": self.settings.bedrock_model_id,
+                            "region": self.settings.bedrock_llm_region,
+                        },
+                    )
+                    orchestrator: IAgentOrchestrator = LangGraphOrchestrator(
+                        llm_model_id=self.settings.bedrock_model_id,
+                        region=self.settings.bedrock_llm_region,
+                        agent_tools=self.create_agent_tools(),
+                        observability_service=self.observability_service,
+                        performance_config={"latency": self.settings.bedrock_performance_mode},
+                        semantic_cache=self.semantic_cache,
+                        session=self._boto_session,
+                    )
+
+                    if self.settings.flash_queries_enabled:
+                        logger.info(
+                            "Enabling flash queries",
+                            extra={"top_k": self.settings.flash_queries_top_k},
+                        )
+                        orchestrator = FlashQueryRegistry(
+                            orchestrator=orchestrator,
+                            top_k=self.settings.flash_queries_top_k,
+                        )
+
+                    self._agent_orchestrator = orchestrator
         return self._agent_orchestrator
 
+    async def aclose(self) -> None:
+        """Stop background tasks owned by container singletons."""
+        aclose = getattr(self._agent_orchestrator, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
 
 # FastAPI dependency providers
 @lru_cache
-def get_container() -> "DIContainer":
+def get_container() -> DIContainer:
     """Get DI container singleton."""
     return DIContainer()
 
 
-def get_cognito_service():
+@lru_cache
+def get_cognito_service() -> CognitoAuthService:
     """FastAPI dependency for Cognito service."""
     return get_container().cognito_service
 
 
-def get_agent_orchestrator():
+@lru_cache
+def get_agent_orchestrator() -> IAgentOrchestrator:
     """FastAPI dependency for agent orchestrator."""
     return get_container().agent_orchestrator
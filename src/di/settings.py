@@ -0,0 +1,101 @@
+"""Application settings loaded from environment variables."""
+import os
+from typing import Literal, Mapping
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class Settings(BaseModel):
+    """
+    Immutable, validated application configuration.
+
+    Fields are populated from environment variables (the field aliases) by
+    from_env(), or directly by field name, e.g. Settings(aws_region="us-west-2")
+    in tests.
+    """
+
+    model_config = ConfigDict(frozen=True, populate_by_name=True, extra="ignore")
+
+    # AWS Configuration
+    aws_region: str = Field("us-east-2", alias="AWS_REGION")
+    bedrock_region: str = Field("us-east-2", alias="BEDROCK_REGION")
+    # Allow LLM runtime to live in a different Bedrock region than other AWS resources
+    bedrock_llm_region: str = Field("us-east-2", alias="BEDROCK_LLM_REGION")
+    bedrock_model_id: str = Field(
+        "us.anthropic.claude-3-5-sonnet-20241022-v2:0", alias="BEDROCK_MODEL_ID"
+    )
+    bedrock_knowledge_base_id: str = Field("", alias="BEDROCK_KNOWLEDGE_BASE_ID")
+    # Bedrock inference latency profile
+    bedrock_performance_mode: Literal["optimized", "standard"] = Field(
+        "optimized", alias="BEDROCK_PERFORMANCE_MODE"
+    )
+
+    # Bound concurrent yfinance requests to stay under Yahoo rate limits
+    yfinance_max_concurrency: int = Field(8, gt=0, alias="YFINANCE_MAX_CONCURRENCY")
+
+    # Short-lived result caches in front of yfinance and the Knowledge Base (0 disables)
+    realtime_price_cache_ttl_seconds: float = Field(
+        5.0, ge=0.0, alias="REALTIME_PRICE_CACHE_TTL_SECONDS"
+    )
+    document_search_cache_ttl_seconds: float = Field(
+        300.0, ge=0.0, alias="DOCUMENT_SEARCH_CACHE_TTL_SECONDS"
+    )
+
+    # Semantic cache Configuration
+    semantic_cache_enabled: bool = Field(True, alias="SEMANTIC_CACHE_ENABLED")
+    semantic_cache_threshold: float = Field(
+        0.95, gt=0.0, le=1.0, alias="SEMANTIC_CACHE_THRESHOLD"
+    )
+    semantic_cache_max_entries: int = Field(1000, gt=0, alias="SEMANTIC_CACHE_MAX_ENTRIES")
+    semantic_cache_ttl_seconds: float = Field(3600.0, gt=0.0, alias="SEMANTIC_CACHE_TTL_SECONDS")
+
+    # Embedding cache Configuration
+    embedding_cache_max_entries: int = Field(10_000, gt=0, alias="EMBEDDING_CACHE_MAX_ENTRIES")
+
+    # Flash queries: pre-evaluate the most frequent agent queries while idle (opt-in)
+    flash_queries_enabled: bool = Field(False, alias="FLASH_QUERIES_ENABLED")
+    flash_queries_top_k: int = Field(10, gt=0, alias="FLASH_QUERIES_TOP_K")
+
+    # Cognito Configuration
+    cognito_user_pool_id: str = Field("", alias="COGNITO_USER_POOL_ID")
+    cognito_app_client_id: str = Field("", alias="COGNITO_APP_CLIENT_ID")
+
+    # Observability Configuration: langfuse or langsmith
+    observability_provider: str = Field("langfuse", alias="OBSERVABILITY_PROVIDER")
+
+    # Langfuse Configuration
+    langfuse_public_key: str = Field("", alias="LANGFUSE_PUBLIC_KEY")
+    langfuse_secret_key: str = Field("", alias="LANGFUSE_SECRET_KEY", repr=False)
+    langfuse_host: str = Field("https://cloud.langfuse.com", alias="LANGFUSE_HOST")
+
+    # LangSmith Configuration
+    langsmith_api_key: str = Field("", alias="LANGSMITH_API_KEY", repr=False)
+    langsmith_project: str = Field("aws-ai-agent", alias="LANGSMITH_PROJECT")
+    langsmith_endpoint: str = Field(
+        "https://api.smith.langchain.com", alias="LANGSMITH_ENDPOINT"
+    )
+
+    @property
+    def cognito_configured(self) -> bool:
+        """Whether both Cognito user pool and app client are set."""
+        return bool(self.cognito_user_pool_id and self.cognito_app_client_id)
+
+    @classmethod
+    def from_env(cls, environ: Mapping[str, str] | None = None) -> "Settings":
+        """
+        Load settings from environment variables.
+
+        Args:
+            environ: Variables to read (defaults to os.environ)
+
+        Returns:
+            Validated Settings instance
+
+        Raises:
+            pydantic.ValidationError: If a variable has an invalid value
+        """
+        env = dict(os.environ if environ is None else environ)
+        # Bedrock regions fall back to the region they are nested under
+        env.setdefault("BEDROCK_REGION", env.get("AWS_REGION", "us-east-2"))
+        env.setdefault("BEDROCK_LLM_REGION", env["BEDROCK_REGION"])
+        return cls.model_validate(env)
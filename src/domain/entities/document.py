@@ -1,10 +1,12 @@
 """Document entity - represents financial documents in knowledge base."""
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import Any, Mapping, Optional
 
+from src.domain.entities.metadata import freeze_metadata, intern_optional
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Document:
     """Represents a document in the knowledge base."""
 
@@ -16,7 +18,7 @@ class Document:
     company: str
     fiscal_period: Optional[str] = None  # e.g., "Q3 2025", "FY 2024"
     published_date: Optional[datetime] = None
-    metadata: Optional[dict[str, str]] = None
+    metadata: Optional[Mapping[str, Any]] = None
 
     def __post_init__(self) -> None:
         """Validate entity invariants."""
@@ -28,9 +30,13 @@ class Document:
             raise ValueError("Document content cannot be empty")
         if not self.company:
             raise ValueError("Company name cannot be empty")
+        # Repeated across every chunk of a document; share one string object each
+        for name in ("company", "document_type", "fiscal_period"):
+            object.__setattr__(self, name, intern_optional(getattr(self, name)))
+        object.__setattr__(self, "metadata", freeze_metadata(self.metadata))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DocumentChunk:
     """Represents a chunk of a document for RAG retrieval."""
 
@@ -39,7 +45,7 @@ class DocumentChunk:
     content: str
     relevance_score: float
     page_number: Optional[int] = None
-    metadata: Optional[dict[str, str]] = None
+    metadata: Optional[Mapping[str, Any]] = None
 
     def __post_init__(self) -> None:
         """Validate entity invariants."""
@@ -49,5 +55,7 @@ class DocumentChunk:
             raise ValueError("Chunk ID cannot be empty")
         if not self.content:
             raise ValueError("Chunk content cannot be empty")
-        if not 0 <= self.relevance_score <= 1:
+        if self.relevance_score < 0.0 or self.relevance_score > 1.0:
             raise ValueError("Relevance score must be between 0 and 1")
+        object.__setattr__(self, "document_id", intern_optional(self.document_id))
+        object.__setattr__(self, "metadata", freeze_metadata(self.metadata))
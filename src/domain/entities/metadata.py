@@ -0,0 +1,38 @@
+"""Read-only metadata mappings and interned identifiers shared by domain entities."""
+import sys
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
+
+
+def freeze_metadata(metadata: Optional[Mapping[str, Any]]) -> Optional[Mapping[str, Any]]:
+    """
+    Return a read-only view of metadata with interned keys.
+
+    Entities are frozen, so their metadata should not be mutable either. Interning
+    lets the many chunks of one document share a single copy of each key string.
+
+    Args:
+        metadata: Metadata mapping, or None
+
+    Returns:
+        MappingProxyType over a copy of the metadata, or None
+    """
+    if metadata is None or isinstance(metadata, MappingProxyType):
+        return metadata
+    return MappingProxyType({sys.intern(key): value for key, value in metadata.items()})
+
+
+def intern_optional(value: Optional[str]) -> Optional[str]:
+    """
+    Intern a repeated identifier string so equal values share one object.
+
+    Interned strings are not immortal in CPython, so values no longer referenced
+    by any entity are still freed.
+
+    Args:
+        value: String to intern, or None
+
+    Returns:
+        The interned string, or the value unchanged if it is not a str
+    """
+    return sys.intern(value) if type(value) is str else value
@@ -1,10 +1,12 @@
 """Query result entity - represents the output of agent queries."""
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, Mapping, Optional
 
+from src.domain.entities.metadata import freeze_metadata
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class AgentStep:
     """Represents a single step in agent reasoning."""
 
@@ -22,7 +24,7 @@ class AgentStep:
             raise ValueError("Action cannot be empty")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class QueryResult:
     """Represents the result of an agent query."""
 
@@ -34,7 +36,7 @@ class QueryResult:
     timestamp: datetime
     trace_id: Optional[str] = None
     trace_url: Optional[str] = None
-    metadata: Optional[dict[str, Any]] = None
+    metadata: Optional[Mapping[str, Any]] = None
 
     def __post_init__(self) -> None:
         """Validate entity invariants."""
@@ -44,13 +46,14 @@ class QueryResult:
             raise ValueError("Answer cannot be empty")
         if self.execution_time_ms < 0:
             raise ValueError("Execution time cannot be negative")
+        object.__setattr__(self, "metadata", freeze_metadata(self.metadata))
 
 
-@dataclass
+@dataclass(slots=True)
 class StreamEvent:
     """Represents a streaming event from the agent."""
 
-    event_type: str  # e.g., "agent_step", "tool_call", "final_answer"
+    event_type: str  # e.g., "agent_step", "tool_calls", "final_answer"
     data: dict[str, Any]
     timestamp: datetime
 
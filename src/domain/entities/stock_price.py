@@ -1,11 +1,11 @@
 """Stock price entity - core business object."""
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
 from typing import Optional
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StockPrice:
     """Represents a stock price at a specific point in time."""
 
@@ -22,15 +22,16 @@ class StockPrice:
 
     def __post_init__(self) -> None:
         """Validate entity invariants."""
+        # Cheapest checks first; the Decimal comparison goes last
         if not self.symbol:
             raise ValueError("Stock symbol cannot be empty")
-        if self.price < 0:
-            raise ValueError("Stock price cannot be negative")
         if self.volume is not None and self.volume < 0:
             raise ValueError("Volume cannot be negative")
+        if self.price < 0:
+            raise ValueError("Stock price cannot be negative")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HistoricalStockPrice:
     """Represents historical stock prices over a period."""
 
@@ -39,6 +40,10 @@ class HistoricalStockPrice:
     end_date: datetime
     prices: list[StockPrice]
     period: str  # e.g., "1d", "1wk", "1mo"
+    # Lazily computed (average, highest, lowest); slots rule out functools.cached_property
+    _stats: Optional[tuple[Decimal, Decimal, Decimal]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         """Validate entity invariants."""
@@ -49,23 +54,30 @@ class HistoricalStockPrice:
         if not self.prices:
             raise ValueError("Historical prices cannot be empty")
 
+    @property
+    def _price_stats(self) -> tuple[Decimal, Decimal, Decimal]:
+        """Compute (average, highest, lowest) once; the entity is immutable."""
+        if self._stats is None:
+            if not self.prices:
+                stats = (Decimal("0"), Decimal("0"), Decimal("0"))
+            else:
+                # Builtins over a plain list avoid three generator passes over the entities
+                prices = [p.price for p in self.prices]
+                stats = (sum(prices) / len(prices), max(prices), min(prices))
+            object.__setattr__(self, "_stats", stats)
+        return self._stats
+
     @property
     def average_price(self) -> Decimal:
         """Calculate average price over the period."""
-        if not self.prices:
-            return Decimal("0")
-        return sum(p.price for p in self.prices) / len(self.prices)
+        return self._price_stats[0]
 
     @property
     def highest_price(self) -> Decimal:
         """Get highest price in the period."""
-        if not self.prices:
-            return Decimal("0")
-        return max(p.price for p in self.prices)
+        return self._price_stats[1]
 
     @property
     def lowest_price(self) -> Decimal:
         """Get lowest price in the period."""
-        if not self.prices:
-            return Decimal("0")
-        return min(p.price for p in self.prices)
+        return self._price_stats[2]
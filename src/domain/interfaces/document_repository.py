@@ -1,13 +1,12 @@
 """Document repository interface - defines contract for document access."""
-from abc import ABC, abstractmethod
 
+from typing import Protocol
 from src.domain.entities.document import Document, DocumentChunk
 
 
-class IDocumentRepository(ABC):
+class IDocumentRepository(Protocol):
     """Interface for document repository."""
 
-    @abstractmethod
     async def search_documents(self, query: str, max_results: int = 5) -> list[DocumentChunk]:
         """
         Search documents using semantic search.
@@ -22,9 +21,8 @@ class IDocumentRepository(ABC):
         Raises:
             RuntimeError: If search operation fails
         """
-        pass
+        ...
 
-    @abstractmethod
     async def get_document_by_id(self, document_id: str) -> Document:
         """
         Retrieve a document by its ID.
@@ -39,9 +37,8 @@ class IDocumentRepository(ABC):
             ValueError: If document_id is invalid
             RuntimeError: If document cannot be retrieved
         """
-        pass
+        ...
 
-    @abstractmethod
     async def list_documents(self, company: str) -> list[Document]:
         """
         List all documents for a company.
@@ -55,4 +52,4 @@ class IDocumentRepository(ABC):
         Raises:
             RuntimeError: If listing operation fails
         """
-        pass
+        ...
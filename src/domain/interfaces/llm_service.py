@@ -1,12 +1,10 @@
 """LLM service interface - defines contract for language model interactions."""
-from abc import ABC, abstractmethod
-from typing import Any, AsyncIterator
+from typing import Any, AsyncIterator, Protocol
 
 
-class ILLMService(ABC):
+class ILLMService(Protocol):
     """Interface for Large Language Model service."""
 
-    @abstractmethod
     async def generate(
         self,
         prompt: str,
@@ -29,10 +27,9 @@ class ILLMService(ABC):
         Raises:
             RuntimeError: If generation fails
         """
-        pass
+        ...
 
-    @abstractmethod
-    async def generate_stream(
+    def generate_stream(
         self,
         prompt: str,
         system_prompt: str | None = None,
@@ -54,9 +51,8 @@ class ILLMService(ABC):
         Raises:
             RuntimeError: If generation fails
         """
-        pass
+        ...
 
-    @abstractmethod
     async def embed_text(self, text: str) -> list[float]:
         """
         Generate embeddings for text.
@@ -70,4 +66,19 @@ class ILLMService(ABC):
         Raises:
             RuntimeError: If embedding fails
         """
-        pass
+        ...
+
+    async def embed_texts(self, texts: list[str]) -> list[list[float]]:
+        """
+        Generate embeddings for several texts at once.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Vector embeddings, in the same order as texts
+
+        Raises:
+            RuntimeError: If any embedding fails
+        """
+        ...
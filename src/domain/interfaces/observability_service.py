@@ -1,13 +1,11 @@
 """Observability service interface - defines contract for tracing and logging."""
-from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, Optional, Protocol
 
 
-class IObservabilityService(ABC):
+class IObservabilityService(Protocol):
     """Interface for observability and tracing services."""
 
-    @abstractmethod
     def get_langchain_callback(
         self,
         user_id: Optional[str] = None,
@@ -31,9 +29,8 @@ class IObservabilityService(ABC):
         Returns:
             A LangChain BaseCallbackHandler instance
         """
-        pass
+        ...
 
-    @abstractmethod
     def create_trace(
         self, name: str, user_id: Optional[str] = None, metadata: Optional[dict[str, Any]] = None
     ) -> str:
@@ -48,9 +45,8 @@ class IObservabilityService(ABC):
         Returns:
             Trace ID
         """
-        pass
+        ...
 
-    @abstractmethod
     def log_llm_generation(
         self,
         trace_id: str,
@@ -71,9 +67,8 @@ class IObservabilityService(ABC):
             output_data: Output from the model
             metadata: Optional metadata
         """
-        pass
+        ...
 
-    @abstractmethod
     def log_tool_execution(
         self,
         trace_id: str,
@@ -94,9 +89,8 @@ class IObservabilityService(ABC):
             error: Optional error message
             metadata: Optional metadata
         """
-        pass
+        ...
 
-    @abstractmethod
     def log_span(
         self,
         trace_id: str,
@@ -115,9 +109,8 @@ class IObservabilityService(ABC):
             end_time: Span end time
             metadata: Optional metadata
         """
-        pass
+        ...
 
-    @abstractmethod
     def complete_trace(
         self,
         trace_id: str,
@@ -132,9 +125,8 @@ class IObservabilityService(ABC):
             outputs: Optional output data
             error: Optional error message
         """
-        pass
+        ...
 
-    @abstractmethod
     def get_trace_url(self, trace_id: str) -> Optional[str]:
         """
         Get the URL for viewing a trace.
@@ -145,9 +137,8 @@ class IObservabilityService(ABC):
         Returns:
             URL to view the trace, or None if not available
         """
-        pass
+        ...
 
-    @abstractmethod
     def flush(self) -> None:
         """Flush pending traces to the observability backend."""
-        pass
+        ...
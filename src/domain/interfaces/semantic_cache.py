@@ -0,0 +1,30 @@
+"""Semantic cache interface - defines contract for embedding-keyed response caching."""
+from typing import Any, Protocol
+
+
+class ISemanticCache(Protocol):
+    """Interface for a cache that matches paraphrased queries by embedding similarity."""
+
+    async def get(self, namespace: str, query: str) -> Any | None:
+        """
+        Look up a cached value for a query or a semantically similar one.
+
+        Args:
+            namespace: Logical partition of the cache (e.g. use case or tenant)
+            query: Natural language query text
+
+        Returns:
+            Cached value, or None on a miss
+        """
+        ...
+
+    async def set(self, namespace: str, query: str, value: Any) -> None:
+        """
+        Store a value for a query.
+
+        Args:
+            namespace: Logical partition of the cache (e.g. use case or tenant)
+            query: Natural language query text
+            value: Value to cache
+        """
+        ...
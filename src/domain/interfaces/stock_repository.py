@@ -1,14 +1,13 @@
 """Stock repository interface - defines contract for stock data access."""
-from abc import ABC, abstractmethod
 from datetime import datetime
+from typing import Protocol
 
 from src.domain.entities.stock_price import HistoricalStockPrice, StockPrice
 
 
-class IStockRepository(ABC):
+class IStockRepository(Protocol):
     """Interface for stock data repository."""
 
-    @abstractmethod
     async def get_realtime_price(self, symbol: str) -> StockPrice:
         """
         Get the current realtime price for a stock symbol.
@@ -23,9 +22,8 @@ class IStockRepository(ABC):
             ValueError: If symbol is invalid
             RuntimeError: If price data cannot be retrieved
         """
-        pass
+        ...
 
-    @abstractmethod
     async def get_historical_prices(
         self,
         symbol: str,
@@ -49,4 +47,4 @@ class IStockRepository(ABC):
             ValueError: If symbol or date range is invalid
             RuntimeError: If historical data cannot be retrieved
         """
-        pass
+        ...
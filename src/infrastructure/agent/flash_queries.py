@@ -0,0 +1,168 @@
+"""Flash queries - speculative pre-evaluation of frequently asked agent queries."""
+import asyncio
+import time
+from collections import Counter
+from dataclasses import replace
+from datetime import datetime
+from typing import AsyncIterator
+
+from src.application.interfaces.agent_orchestrator import IAgentOrchestrator
+from src.domain.entities.query_result import QueryResult, StreamEvent
+from src.infrastructure.agent.langgraph_orchestrator import UNCACHEABLE_TOOLS
+from src.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+PREFETCH_USER_ID = "flash-query-prefetch"
+
+
+class FlashQueryRegistry:
+    """
+    Orchestrator decorator that pre-runs the most frequent queries while idle.
+
+    Query frequencies are counted in-process. A background task periodically
+    re-evaluates the top-K queries whenever no user request is in flight, so a
+    repeat of a popular question is answered from memory. Answers that used
+    realtime price data expire after ``realtime_ttl_seconds`` instead of being
+    invalidated per market tick.
+    """
+
+    def __init__(
+        self,
+        orchestrator: IAgentOrchestrator,
+        top_k: int = 10,
+        refresh_interval_seconds: float = 300.0,
+        ttl_seconds: float = 600.0,
+        realtime_ttl_seconds: float = 15.0,
+        max_tracked_queries: int = 1000,
+    ) -> None:
+        """
+        Initialize flash query registry.
+
+        Args:
+            orchestrator: Orchestrator used to answer and pre-evaluate queries
+            top_k: Number of most frequent queries to keep pre-evaluated
+            refresh_interval_seconds: Delay between pre-evaluation rounds
+            ttl_seconds: Lifetime of a pre-evaluated answer
+            realtime_ttl_seconds: Lifetime of answers built from realtime prices
+            max_tracked_queries: Bound on distinct queries counted
+        """
+        self._orchestrator = orchestrator
+        self._top_k = top_k
+        self._refresh_interval = refresh_interval_seconds
+        self._ttl = ttl_seconds
+        self._realtime_ttl = realtime_ttl_seconds
+        self._max_tracked = max_tracked_queries
+
+        self._counts: Counter[str] = Counter()
+        self._originals: dict[str, str] = {}
+        self._results: dict[str, tuple[QueryResult, float]] = {}
+        self._inflight = 0
+        self._task: asyncio.Task | None = None
+
+    async def process_query(self, query: str, user_id: str) -> QueryResult:
+        """Answer from the flash cache when possible, otherwise delegate."""
+        self._ensure_started()
+        key = self._record(query)
+
+        cached = self._results.get(key)
+        if cached is not None and cached[1] > time.monotonic():
+            logger.info("Flash query hit", extra={"user_id": user_id})
+            return replace(
+                cached[0],
+                query=query,
+                execution_time_ms=0.0,
+                timestamp=datetime.now(),
+                trace_id=None,
+                trace_url=None,
+                metadata={"cache_hit": True, "flash_query": True},
+            )
+
+        self._inflight += 1
+        try:
+            return await self._orchestrator.process_query(query, user_id)
+        finally:
+            self._inflight -= 1
+
+    async def process_query_stream(
+        self, query: str, user_id: str
+    ) -> AsyncIterator[StreamEvent]:
+        """Delegate streaming queries, counting them towards query frequency."""
+        self._ensure_started()
+        self._record(query)
+
+        self._inflight += 1
+        try:
+            async for event in self._orchestrator.process_query_stream(query, user_id):
+                yield event
+        finally:
+            self._inflight -= 1
+
+    def process_query_partial(
+        self, query: str, user_id: str
+    ) -> tuple[AsyncIterator[StreamEvent], "asyncio.Future[QueryResult]"]:
+        """Delegate partial-result queries, counting them towards query frequency."""
+        self._ensure_started()
+        self._record(query)
+        return self._orchestrator.process_query_partial(query, user_id)
+
+    async def aclose(self) -> None:
+        """Stop the background pre-evaluation task and close the wrapped orchestrator."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        aclose = getattr(self._orchestrator, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+    def _ensure_started(self) -> None:
+        """Start the background task on first use, inside the running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def _record(self, query: str) -> str:
+        """Count a query and return its normalized key."""
+        key = " ".join(query.lower().split())
+        if key not in self._counts and len(self._counts) >= self._max_tracked:
+            # Drop the rarest half so new popular queries can still surface
+            for stale, _ in self._counts.most_common()[self._max_tracked // 2 :]:
+                del self._counts[stale]
+                self._originals.pop(stale, None)
+        self._counts[key] += 1
+        self._originals.setdefault(key, query)
+        return key
+
+    async def _run(self) -> None:
+        """Periodically pre-evaluate the most frequent queries while idle."""
+        while True:
+            await asyncio.sleep(self._refresh_interval)
+            top_keys = [key for key, _ in self._counts.most_common(self._top_k)]
+
+            for key in self._results.keys() - set(top_keys):
+                del self._results[key]
+
+            for key in top_keys:
+                if self._inflight:
+                    break
+                await self._prefetch(key)
+
+    async def _prefetch(self, key: str) -> None:
+        """Evaluate one query and store its answer."""
+        query = self._originals.get(key)
+        if query is None:
+            return
+
+        try:
+            result = await self._orchestrator.process_query(query, PREFETCH_USER_ID)
+        except Exception as e:
+            logger.warning("Flash query pre-evaluation failed", extra={"error": str(e)})
+            return
+
+        realtime = any(step.action in UNCACHEABLE_TOOLS for step in result.reasoning_steps)
+        ttl = self._realtime_ttl if realtime else self._ttl
+        self._results[key] = (result, time.monotonic() + ttl)
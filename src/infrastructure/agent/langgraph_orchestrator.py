@@ -1,20 +1,93 @@
 """LangGraph orchestrator implementation with ReAct pattern."""
+import asyncio
+import hashlib
+import re
+import time
+from dataclasses import replace
 from datetime import datetime
-from typing import Annotated, Any, AsyncIterator, TypedDict
+from typing import Annotated, Any, AsyncIterator, Iterator, Mapping, TypedDict
 
+import boto3
 from langchain_aws import ChatBedrockConverse
-from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+from langchain_core.messages import AIMessage, AIMessageChunk, HumanMessage, ToolMessage
 from langgraph.graph import END, START, StateGraph, add_messages
 from langgraph.prebuilt import ToolNode
 
-from src.application.interfaces.agent_orchestrator import IAgentOrchestrator
 from src.domain.entities.query_result import AgentStep, QueryResult, StreamEvent
 from src.domain.interfaces.observability_service import IObservabilityService
-from src.infrastructure.agent.tools import AgentTools
+from src.domain.interfaces.semantic_cache import ISemanticCache
+from src.infrastructure.agent.query_router import QueryRoute, classify_query, direct_answer
+from src.infrastructure.agent.tools import TERMINAL_RESULT_PREFIXES, AgentTools
+from src.infrastructure.aws.boto import default_config
 from src.infrastructure.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Model families that accept Bedrock's latency-optimized inference profile.
+# Other models reject performanceConfig={"latency": "optimized"} with a ValidationException.
+LATENCY_OPTIMIZED_MODELS = (
+    "anthropic.claude-3-5-haiku",
+    "meta.llama3-1-70b",
+    "meta.llama3-1-405b",
+    "amazon.nova-pro",
+)
+
+# Model families that support Bedrock prompt caching. For these the static system
+# prompt ends with a cache point, so later turns and queries reuse the cached prefix.
+PROMPT_CACHING_MODELS = (
+    "anthropic.claude-3-5-haiku",
+    "anthropic.claude-3-7-sonnet",
+    "anthropic.claude-sonnet-4",
+    "anthropic.claude-opus-4",
+    "amazon.nova",
+)
+_CACHE_POINT = {"cachePoint": {"type": "default"}}
+
+# Single-tenant deployment: answers do not depend on the caller, so all users share one
+# cache namespace. Scope this per tenant if the user pool ever becomes multi-tenant.
+AGENT_CACHE_NAMESPACE = "agent:default"
+
+LLM_TEMPERATURE = 0.7
+
+# Cached answers are replayed to streaming clients in chunks of this many words
+CACHED_TOKEN_CHUNK_WORDS = 20
+_WORDS = re.compile(r"\S+\s*")
+
+# Shared by every invoke config; Langfuse only reads it (tags must be a list)
+_LANGFUSE_TAGS = ["agent_query"]
+
+# Invoke config when observability is off; LangGraph copies configs, never mutates them
+_EMPTY_CONFIG: dict[str, Any] = {}
+
+# Answers built from these tools go stale within seconds and must never be cached
+UNCACHEABLE_TOOLS = frozenset({"retrieve_realtime_stock_price"})
+
+# Cheap intent detection used to prefetch tool results before the LLM plans
+_PRICE_INTENT = re.compile(r"\b(price|prices|trading|quote|stock|shares?|worth)\b", re.IGNORECASE)
+_DOCUMENT_INTENT = re.compile(
+    r"\b(report|earnings|guidance|revenue|filing|annual|quarter|quarterly"
+    r"|10-[kq]|margin|outlook)\b",
+    re.IGNORECASE,
+)
+_TICKER = re.compile(r"\$?\b([A-Z]{1,5})\b")
+_NON_TICKERS = frozenset(
+    {"A", "I", "AI", "AWS", "CEO", "CFO", "EPS", "ETF", "FY", "GAAP", "IPO", "SEC", "US", "USD"}
+)
+_COMPANY_TICKERS = {"amazon": "AMZN"}
+
+
+def _elapsed_ms(start_ns: int) -> float:
+    """Milliseconds elapsed since a time.perf_counter_ns() reading."""
+    return (time.perf_counter_ns() - start_ns) / 1e6
+
+
+def _extend_steps(
+    left: list[dict[str, Any]], right: list[dict[str, Any]]
+) -> list[dict[str, Any]]:
+    """Append a turn's reasoning steps; turns without tool calls keep the list as is."""
+    # LangGraph may hold references to earlier channel values, so never mutate left
+    return left + right if right else left
+
 
 class AgentState(TypedDict):
     """State for the agent graph.
@@ -25,11 +98,11 @@ class AgentState(TypedDict):
     """
 
     messages: Annotated[list, add_messages]
-    reasoning_steps: list[dict[str, Any]]
+    reasoning_steps: Annotated[list[dict[str, Any]], _extend_steps]
     final_answer: str | None
 
 
-class LangGraphOrchestrator(IAgentOrchestrator):
+class LangGraphOrchestrator:
     """Agent orchestrator using LangGraph with ReAct pattern."""
 
     def __init__(
@@ -38,6 +111,9 @@ class LangGraphOrchestrator(IAgentOrchestrator):
         region: str,
         agent_tools: AgentTools,
         observability_service: IObservabilityService | None = None,
+        performance_config: Mapping[str, Any] | None = None,
+        semantic_cache: ISemanticCache | None = None,
+        session: boto3.Session | None = None,
     ) -> None:
         """
         Initialize LangGraph orchestrator.
@@ -47,23 +123,49 @@ class LangGraphOrchestrator(IAgentOrchestrator):
             region: AWS region
             agent_tools: Agent tools factory
             observability_service: Optional observability service (Langfuse or LangSmith)
+            performance_config: Optional Bedrock performanceConfig, e.g. {"latency": "optimized"}
+            semantic_cache: Optional cache for answers to paraphrased repeat queries
+            session: Optional shared boto3 session to create the Bedrock clients from
         """
         logger.info(
             "Initializing LangGraph orchestrator",
             extra={"model_id": llm_model_id, "region": region},
         )
 
+        # The prompt is invariant, so it is configured once as the model's top-level
+        # Converse system field instead of being prepended to every run's messages
+        self._system_prompt = self._create_system_prompt()
+
+        llm_kwargs: dict[str, Any] = {}
+        performance_config = self._resolve_performance_config(llm_model_id, performance_config)
+        if performance_config:
+            llm_kwargs["performance_config"] = performance_config
+        if session is not None:
+            config = default_config(region)
+            llm_kwargs["client"] = session.client("bedrock-runtime", config=config)
+            llm_kwargs["bedrock_client"] = session.client("bedrock", config=config)
+
         # ChatBedrockConverse uses Converse API - supports cross-region inference profiles
         self._llm = ChatBedrockConverse(
             model=llm_model_id,
             region_name=region,
-            temperature=0.7,
+            temperature=LLM_TEMPERATURE,
             max_tokens=2048,
+            system=self._build_system_blocks(llm_model_id, self._system_prompt),
+            **llm_kwargs,
         )
 
+        self._agent_tools = agent_tools
         self._tools = agent_tools.create_tools()
         self._llm_with_tools = self._llm.bind_tools(self._tools)
+        # ToolNode indexes the tools by name when constructed; build it once with the tools
+        self._tool_node = ToolNode(self._tools)
         self._observability = observability_service
+        self._semantic_cache = semantic_cache
+        # Pending background observability flush, if any
+        self._flush_future: asyncio.Future[None] | None = None
+
+        self._cache_namespace = self._build_cache_namespace(llm_model_id)
 
         logger.info(f"Agent tools configured: {len(self._tools)} tools available")
 
@@ -71,13 +173,49 @@ class LangGraphOrchestrator(IAgentOrchestrator):
         self._graph = self._build_graph()
         logger.info("LangGraph workflow compiled successfully")
 
+    @staticmethod
+    def _resolve_performance_config(
+        llm_model_id: str, performance_config: Mapping[str, Any] | None
+    ) -> dict[str, Any] | None:
+        """Drop the latency-optimized profile for models that do not support it."""
+        if not performance_config:
+            return None
+
+        if performance_config.get("latency") == "optimized" and not any(
+            family in llm_model_id for family in LATENCY_OPTIMIZED_MODELS
+        ):
+            logger.info(
+                "Latency-optimized inference not supported by model, using standard",
+                extra={"model_id": llm_model_id},
+            )
+            return None
+
+        return dict(performance_config)
+
+    @staticmethod
+    def _build_system_blocks(llm_model_id: str, system_prompt: str) -> list[Any]:
+        """Build the Converse system blocks, marking a prompt cache prefix where supported."""
+        if any(family in llm_model_id for family in PROMPT_CACHING_MODELS):
+            return [system_prompt, _CACHE_POINT]
+        return [system_prompt]
+
+    def _build_cache_namespace(self, llm_model_id: str) -> str:
+        """Scope cached answers to the prompt, model and sampling settings that produced them."""
+        digest = hashlib.sha256(
+            "|".join(
+                (self._system_prompt, llm_model_id, str(LLM_TEMPERATURE))
+            ).encode()
+        ).hexdigest()[:16]
+        return f"{AGENT_CACHE_NAMESPACE}:{digest}"
+
     def _build_graph(self) -> Any:
         """Build the LangGraph workflow using Graph API."""
         workflow = StateGraph(AgentState)
 
         # Define nodes
         workflow.add_node("agent", self._agent_node)
-        workflow.add_node("tools", ToolNode(self._tools))
+        workflow.add_node("tools", self._tool_node)
+        workflow.add_node("finalize", self._finalize_node)
 
         # Define edges using START constant
         workflow.add_edge(START, "agent")
@@ -86,7 +224,12 @@ class LangGraphOrchestrator(IAgentOrchestrator):
             self._should_continue,
             ["tools", END],
         )
-        workflow.add_edge("tools", "agent")
+        workflow.add_conditional_edges(
+            "tools",
+            self._tools_should_finalize,
+            ["agent", "finalize"],
+        )
+        workflow.add_edge("finalize", END)
 
         return workflow.compile()
 
@@ -95,33 +238,57 @@ class LangGraphOrchestrator(IAgentOrchestrator):
         messages = state["messages"]
         response = await self._llm_with_tools.ainvoke(messages)
 
-        # Track reasoning steps for tool calls
-        new_steps = []
-        if hasattr(response, "tool_calls") and response.tool_calls:
-            for tool_call in response.tool_calls:
-                new_steps.append(
-                    {
-                        "action": tool_call["name"],
-                        "action_input": tool_call["args"],
-                        "timestamp": datetime.now(),
-                    }
-                )
+        # Track reasoning steps for tool calls (all requested at the same moment)
+        tool_calls = getattr(response, "tool_calls", None) or []
+        timestamp = datetime.now()
+        new_steps = [
+            {
+                "action": tool_call["name"],
+                "action_input": tool_call["args"],
+                "timestamp": timestamp,
+            }
+            for tool_call in tool_calls
+        ]
 
         return {
             "messages": [response],
-            "reasoning_steps": state["reasoning_steps"] + new_steps,
+            "reasoning_steps": new_steps,
         }
 
     def _should_continue(self, state: AgentState) -> str:
         """Determine whether to continue to tools or end."""
         last_message = state["messages"][-1]
 
-        if hasattr(last_message, "tool_calls") and last_message.tool_calls:
+        if getattr(last_message, "tool_calls", None):
             return "tools"
 
         return END
 
-    def _create_system_prompt(self) -> str:
+    @staticmethod
+    def _last_tool_results(state: AgentState) -> list[str]:
+        """Contents of the tool messages produced by the latest tools step."""
+        results: list[str] = []
+        for message in reversed(state["messages"]):
+            if not isinstance(message, ToolMessage):
+                break
+            results.append(message.text)
+        results.reverse()
+        return results
+
+    def _tools_should_finalize(self, state: AgentState) -> str:
+        """Skip the next LLM turn when every tool result is already a final answer."""
+        results = self._last_tool_results(state)
+        if results and all(result.startswith(TERMINAL_RESULT_PREFIXES) for result in results):
+            return "finalize"
+        return "agent"
+
+    def _finalize_node(self, state: AgentState) -> dict:
+        """Answer directly with the terminal tool results, without calling the model."""
+        answer = "\n\n".join(dict.fromkeys(self._last_tool_results(state)))
+        return {"messages": [AIMessage(content=answer)], "final_answer": answer}
+
+    @staticmethod
+    def _create_system_prompt() -> str:
         """Create system prompt for the agent."""
         return """You are a helpful financial AI agent specialized in stock market analysis and Amazon's financial information.
 
@@ -144,18 +311,23 @@ Think step by step and use the tools methodically to answer user queries accurat
 
         In Langfuse v3, trace attributes are passed via config["metadata"]
         with langfuse_ prefix. The CallbackHandler reads these automatically.
+        A handler is still created per request: it records the trace ID that
+        the QueryResult reports, so sharing one would mix up concurrent traces.
         """
+        if self._observability is None:
+            # Nothing reads trace metadata without a provider; skip building it
+            return _EMPTY_CONFIG
+
         config: dict[str, Any] = {
             "metadata": {
                 "langfuse_user_id": user_id,
-                "langfuse_tags": ["agent_query"],
+                "langfuse_tags": _LANGFUSE_TAGS,
             },
         }
 
-        if self._observability:
-            callback = self._observability.get_langchain_callback(user_id=user_id)
-            if callback is not None:
-                config["callbacks"] = [callback]
+        callback = self._observability.get_langchain_callback(user_id=user_id)
+        if callback is not None:
+            config["callbacks"] = [callback]
 
         return config
 
@@ -179,82 +351,24 @@ Think step by step and use the tools methodically to answer user queries accurat
             raise ValueError("Query cannot be empty")
 
         logger.info("Processing agent query", extra={"query": query, "user_id": user_id})
-        start_time = datetime.now()
+        start_ns = time.perf_counter_ns()
 
-        try:
-            # Initialize state
-            initial_state: AgentState = {
-                "messages": [
-                    SystemMessage(content=self._create_system_prompt()),
-                    HumanMessage(content=query),
-                ],
-                "reasoning_steps": [],
-                "final_answer": None,
-            }
+        direct = self._get_direct_result(query, start_ns)
+        if direct is not None:
+            return direct
 
-            # Build config with observability callbacks
-            config = self._build_invoke_config(user_id)
+        cached = await self._get_cached_result(query, start_ns)
+        if cached is not None:
+            return cached
 
-            # Run the graph - callbacks handle all tracing automatically
-            logger.info("Executing agent graph")
-            final_state = await self._graph.ainvoke(initial_state, config=config)
+        self._start_prefetch(query)
 
-            # Extract final answer
-            last_message = final_state["messages"][-1]
-            answer = (
-                last_message.content
-                if isinstance(last_message, AIMessage)
-                else str(last_message)
-            )
-
-            # Convert reasoning steps to AgentStep entities
-            reasoning_steps = []
-            for idx, step in enumerate(final_state["reasoning_steps"], 1):
-                reasoning_steps.append(
-                    AgentStep(
-                        step_number=idx,
-                        action=step["action"],
-                        action_input=step["action_input"],
-                        observation="",
-                        timestamp=step["timestamp"],
-                    )
-                )
-
-            execution_time_ms = (datetime.now() - start_time).total_seconds() * 1000
-
-            logger.info(
-                "Agent query completed",
-                extra={
-                    "execution_time_ms": round(execution_time_ms, 2),
-                    "reasoning_steps_count": len(reasoning_steps),
-                },
-            )
-
-            # Flush observability data and get trace URL
-            trace_id = None
-            trace_url = None
-            if self._observability:
-                self._observability.flush()
-                try:
-                    handler = getattr(self._observability, '_last_handler', None)
-                    if handler and hasattr(handler, 'last_trace_id'):
-                        trace_id = handler.last_trace_id
-                        if trace_id:
-                            trace_url = self._observability.get_trace_url(trace_id)
-                            logger.info("Langfuse trace captured", extra={"trace_id": trace_id, "trace_url": trace_url})
-                except Exception as e:
-                    logger.warning(f"Could not get Langfuse trace ID: {e}")
-
-            return QueryResult(
-                query=query,
-                answer=answer,
-                reasoning_steps=reasoning_steps,
-                sources=[],
-                execution_time_ms=execution_time_ms,
-                timestamp=datetime.now(),
-                trace_id=trace_id,
-                trace_url=trace_url,
+        try:
+            result = await self._collect_result(
+                query, self._run_graph(query, user_id), start_ns
             )
+            await self._cache_result(query, result)
+            return result
 
         except Exception as e:
             logger.error(
@@ -262,7 +376,78 @@ Think step by step and use the tools methodically to answer user queries accurat
                 extra={"error": str(e), "query": query, "user_id": user_id},
                 exc_info=True,
             )
-            raise RuntimeError(f"Failed to process query: {str(e)}")
+            raise RuntimeError(f"Failed to process query: {str(e)}") from e
+
+    def _start_prefetch(self, query: str) -> None:
+        """Speculatively fetch tool results the query is likely to need."""
+        symbol = self._detect_symbol(query) if _PRICE_INTENT.search(query) else None
+        documents_query = query if _DOCUMENT_INTENT.search(query) else None
+
+        if symbol or documents_query:
+            logger.info(
+                "Prefetching tool results",
+                extra={"symbol": symbol, "documents": bool(documents_query)},
+            )
+            self._agent_tools.prefetch(query=documents_query, symbol=symbol)
+
+    @staticmethod
+    def _detect_symbol(query: str) -> str | None:
+        """Find the first ticker symbol (or known company name) in a query."""
+        for candidate in _TICKER.findall(query):
+            if candidate not in _NON_TICKERS:
+                return candidate
+
+        lowered = query.lower()
+        for company, ticker in _COMPANY_TICKERS.items():
+            if company in lowered:
+                return ticker
+        return None
+
+    @staticmethod
+    def _get_direct_result(query: str, start_ns: int) -> QueryResult | None:
+        """Answer small talk and reject junk input locally, without invoking the graph."""
+        route = classify_query(query)
+        if route is QueryRoute.GRAPH:
+            return None
+
+        execution_time_ms = _elapsed_ms(start_ns)
+        logger.info(
+            "Agent query answered without the graph",
+            extra={"route": route.value, "execution_time_ms": round(execution_time_ms, 2)},
+        )
+        return QueryResult(
+            query=query,
+            answer=direct_answer(query, route),
+            reasoning_steps=[],
+            sources=[],
+            execution_time_ms=execution_time_ms,
+            timestamp=datetime.now(),
+            metadata={"route": route.value},
+        )
+
+    async def _get_cached_result(self, query: str, start_ns: int) -> QueryResult | None:
+        """Return a cached answer for the query, re-stamped for this request."""
+        if self._semantic_cache is None:
+            return None
+
+        cached = await self._semantic_cache.get(self._cache_namespace, query)
+        if cached is None:
+            return None
+
+        execution_time_ms = _elapsed_ms(start_ns)
+        logger.info(
+            "Agent query served from semantic cache",
+            extra={"execution_time_ms": round(execution_time_ms, 2)},
+        )
+        return replace(
+            cached,
+            query=query,
+            execution_time_ms=execution_time_ms,
+            timestamp=datetime.now(),
+            trace_id=None,
+            trace_url=None,
+            metadata={"cache_hit": True},
+        )
 
     async def process_query_stream(
         self, query: str, user_id: str
@@ -285,75 +470,311 @@ Think step by step and use the tools methodically to answer user queries accurat
             raise ValueError("Query cannot be empty")
 
         try:
-            # Initialize state
-            initial_state: AgentState = {
-                "messages": [
-                    SystemMessage(content=self._create_system_prompt()),
-                    HumanMessage(content=query),
-                ],
-                "reasoning_steps": [],
-                "final_answer": None,
-            }
+            start_ns = time.perf_counter_ns()
+            direct = self._get_direct_result(query, start_ns)
+            if direct is not None:
+                for event in self._replay_events(direct, state=direct.metadata["route"]):
+                    yield event
+                return
+
+            cached = await self._get_cached_result(query, start_ns)
+            if cached is not None:
+                for event in self._replay_events(cached):
+                    yield event
+                return
+
+            self._start_prefetch(query)
+
+            async for event in self._run_graph(query, user_id):
+                yield event
+
+        except Exception as e:
+            yield self._error_event(e)
+
+    def process_query_partial(
+        self, query: str, user_id: str
+    ) -> tuple[AsyncIterator[StreamEvent], "asyncio.Future[QueryResult]"]:
+        """
+        Process a user query, exposing streaming events and the final result together.
+
+        The graph runs in a background task, so the result future resolves even if
+        the caller never consumes the events.
+
+        Args:
+            query: User's natural language query
+            user_id: Unique identifier for the user making the query
 
-            # Build config with observability callbacks
-            config = self._build_invoke_config(user_id)
-
-            # Stream events from the graph
-            event = None
-            async for event in self._graph.astream(initial_state, config=config):
-                for node_name, node_state in event.items():
-                    if node_name == "agent":
-                        yield StreamEvent(
-                            event_type="agent_step",
-                            data={"node": node_name, "state": "reasoning"},
-                            timestamp=datetime.now(),
-                        )
-
-                        if node_state.get("messages"):
-                            last_message = node_state["messages"][-1]
-                            if (
-                                hasattr(last_message, "tool_calls")
-                                and last_message.tool_calls
-                            ):
-                                for tool_call in last_message.tool_calls:
-                                    yield StreamEvent(
-                                        event_type="tool_call",
-                                        data={
-                                            "tool": tool_call["name"],
-                                            "args": tool_call["args"],
-                                        },
-                                        timestamp=datetime.now(),
-                                    )
-
-                    elif node_name == "tools":
-                        yield StreamEvent(
-                            event_type="tool_execution",
-                            data={"node": node_name},
-                            timestamp=datetime.now(),
-                        )
-
-            # Final answer
-            if event is not None:
-                last_message = list(event.values())[0]["messages"][-1]
-                answer = (
-                    last_message.content
-                    if isinstance(last_message, AIMessage)
-                    else str(last_message)
+        Returns:
+            Tuple of (stream of StreamEvent objects, future resolving to the QueryResult)
+
+        Raises:
+            ValueError: If query is invalid
+        """
+        if not query or not query.strip():
+            raise ValueError("Query cannot be empty")
+
+        start_ns = time.perf_counter_ns()
+        direct = self._get_direct_result(query, start_ns)
+        if direct is not None:
+            future: asyncio.Future[QueryResult] = asyncio.get_running_loop().create_future()
+            future.set_result(direct)
+            return self._replay_stream(direct, state=direct.metadata["route"]), future
+
+        self._start_prefetch(query)
+        queue: asyncio.Queue[StreamEvent | None] = asyncio.Queue()
+
+        async def tee() -> AsyncIterator[StreamEvent]:
+            async for event in self._run_graph(query, user_id):
+                queue.put_nowait(event)
+                yield event
+
+        async def run() -> QueryResult:
+            try:
+                result = await self._collect_result(query, tee(), start_ns)
+                await self._cache_result(query, result)
+                return result
+            except Exception as e:
+                logger.error(
+                    "Agent query failed",
+                    extra={"error": str(e), "query": query, "user_id": user_id},
+                    exc_info=True,
                 )
+                queue.put_nowait(self._error_event(e))
+                raise RuntimeError(f"Failed to process query: {str(e)}") from e
+            finally:
+                queue.put_nowait(None)
+
+        async def events() -> AsyncIterator[StreamEvent]:
+            while (event := await queue.get()) is not None:
+                yield event
+
+        return events(), asyncio.ensure_future(run())
+
+    @staticmethod
+    def _build_messages(query: str) -> list[Any]:
+        """
+        Build the initial conversation for a run.
+
+        Bedrock prompt caching reuses the longest byte-identical prefix, which here
+        is the tools and the system prompt configured on the model. Keep per-request
+        values (user id, trace id, timestamps) out of message content, and insert any
+        future retrieved context after that prefix, immediately before the query.
+        """
+        return [HumanMessage(content=query)]
+
+    async def _run_graph(self, query: str, user_id: str) -> AsyncIterator[StreamEvent]:
+        """
+        Run the agent graph, yielding progress and token events as they happen.
+
+        The "messages" stream mode makes LangGraph call the model through the
+        Converse streaming API, so answer tokens are emitted as they are generated.
+        The last event is always "final_answer"; failures propagate to the caller.
+        """
+        initial_state: AgentState = {
+            "messages": self._build_messages(query),
+            "reasoning_steps": [],
+            "final_answer": None,
+        }
+
+        # Build config with observability callbacks
+        config = self._build_invoke_config(user_id)
+
+        logger.info("Executing agent graph")
+        last_message = None
+        async for mode, chunk in self._graph.astream(
+            initial_state, config=config, stream_mode=["updates", "messages"]
+        ):
+            if mode == "messages":
+                message, metadata = chunk
+                text = message.text if isinstance(message, AIMessageChunk) else ""
+                if text and metadata.get("langgraph_node") == "agent":
+                    yield StreamEvent(
+                        event_type="token",
+                        data={"text": text},
+                        timestamp=datetime.now(),
+                    )
+                continue
+
+            # Events from one graph update share a timestamp
+            timestamp = datetime.now()
+            for node_name, node_state in chunk.items():
+                if node_name == "agent":
+                    yield StreamEvent(
+                        event_type="agent_step",
+                        data={"node": node_name, "state": "reasoning"},
+                        timestamp=timestamp,
+                    )
+
+                    if node_state.get("messages"):
+                        last_message = node_state["messages"][-1]
+                        # Parallel tool calls of one turn are reported as a single event
+                        tool_calls = getattr(last_message, "tool_calls", None)
+                        if tool_calls:
+                            yield StreamEvent(
+                                event_type="tool_calls",
+                                data={
+                                    "calls": [
+                                        {"tool": call["name"], "args": call["args"]}
+                                        for call in tool_calls
+                                    ]
+                                },
+                                timestamp=timestamp,
+                            )
+
+                elif node_name == "tools":
+                    yield StreamEvent(
+                        event_type="tool_execution",
+                        data={"node": node_name},
+                        timestamp=timestamp,
+                    )
+
+                elif node_name == "finalize":
+                    last_message = node_state["messages"][-1]
+
+        if last_message is not None:
+            # Streamed Converse responses carry content blocks; .text joins the text parts
+            answer = (
+                last_message.text
+                if isinstance(last_message, AIMessage)
+                else str(last_message)
+            )
+            yield StreamEvent(
+                event_type="final_answer",
+                data={"answer": answer},
+                timestamp=datetime.now(),
+            )
+
+        self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        """Flush observability data in a worker thread, off the response path."""
+        if self._observability is None:
+            return
+        # One pending flush covers every trace finished before it runs
+        if self._flush_future is not None and not self._flush_future.done():
+            return
+        self._flush_future = asyncio.get_running_loop().run_in_executor(
+            None, self._observability.flush
+        )
 
-                yield StreamEvent(
-                    event_type="final_answer",
-                    data={"answer": answer},
-                    timestamp=datetime.now(),
+    async def aclose(self) -> None:
+        """Wait for pending observability data to be exported."""
+        if self._observability is None:
+            return
+        if self._flush_future is not None:
+            await self._flush_future
+            self._flush_future = None
+        await asyncio.to_thread(self._observability.flush)
+
+    async def _collect_result(
+        self,
+        query: str,
+        events: AsyncIterator[StreamEvent],
+        start_ns: int,
+    ) -> QueryResult:
+        """Drain graph events into a QueryResult."""
+        reasoning_steps: list[AgentStep] = []
+        answer = ""
+        async for event in events:
+            if event.event_type == "tool_calls":
+                reasoning_steps.extend(
+                    AgentStep(
+                        step_number=step_number,
+                        action=call["tool"],
+                        action_input=call["args"],
+                        observation="",
+                        timestamp=event.timestamp,
+                    )
+                    for step_number, call in enumerate(
+                        event.data["calls"], len(reasoning_steps) + 1
+                    )
                 )
+            elif event.event_type == "final_answer":
+                answer = event.data["answer"]
+
+        execution_time_ms = _elapsed_ms(start_ns)
 
-            # Flush observability data
-            if self._observability:
-                self._observability.flush()
+        logger.info(
+            "Agent query completed",
+            extra={
+                "execution_time_ms": round(execution_time_ms, 2),
+                "reasoning_steps_count": len(reasoning_steps),
+            },
+        )
 
+        trace_id, trace_url = self._get_trace()
+
+        return QueryResult(
+            query=query,
+            answer=answer,
+            reasoning_steps=reasoning_steps,
+            sources=[],
+            execution_time_ms=execution_time_ms,
+            timestamp=datetime.now(),
+            trace_id=trace_id,
+            trace_url=trace_url,
+        )
+
+    def _get_trace(self) -> tuple[str | None, str | None]:
+        """Get the trace ID and URL of the last traced run, if available."""
+        if not self._observability:
+            return None, None
+
+        try:
+            handler = getattr(self._observability, '_last_handler', None)
+            trace_id = getattr(handler, 'last_trace_id', None)
+            if trace_id:
+                trace_url = self._observability.get_trace_url(trace_id)
+                logger.info("Langfuse trace captured", extra={"trace_id": trace_id, "trace_url": trace_url})
+                return trace_id, trace_url
         except Exception as e:
+            logger.warning(f"Could not get Langfuse trace ID: {e}")
+        return None, None
+
+    async def _cache_result(self, query: str, result: QueryResult) -> None:
+        """Store a result in the semantic cache unless it depends on realtime data."""
+        if self._semantic_cache is not None and not any(
+            step.action in UNCACHEABLE_TOOLS for step in result.reasoning_steps
+        ):
+            await self._semantic_cache.set(self._cache_namespace, query, result)
+
+    @staticmethod
+    def _replay_events(result: QueryResult, state: str = "cached") -> Iterator[StreamEvent]:
+        """Replay a precomputed answer as the event sequence a live run would emit."""
+        # The replay is emitted in one burst, so all its events share a timestamp
+        timestamp = datetime.now()
+        yield StreamEvent(
+            event_type="agent_step",
+            data={"node": "agent", "state": state},
+            timestamp=timestamp,
+        )
+
+        # Chunk by words (keeping whitespace) so clients render it like live tokens
+        words = _WORDS.findall(result.answer)
+        for start in range(0, len(words), CACHED_TOKEN_CHUNK_WORDS):
             yield StreamEvent(
-                event_type="error",
-                data={"error": str(e)},
-                timestamp=datetime.now(),
+                event_type="token",
+                data={"text": "".join(words[start : start + CACHED_TOKEN_CHUNK_WORDS])},
+                timestamp=timestamp,
             )
+
+        yield StreamEvent(
+            event_type="final_answer",
+            data={"answer": result.answer, **result.metadata},
+            timestamp=timestamp,
+        )
+
+    @classmethod
+    async def _replay_stream(cls, result: QueryResult, state: str) -> AsyncIterator[StreamEvent]:
+        """Async view of _replay_events for callers expecting an event stream."""
+        for event in cls._replay_events(result, state=state):
+            yield event
+
+    @staticmethod
+    def _error_event(error: Exception) -> StreamEvent:
+        """Build the stream event reported when the agent fails."""
+        return StreamEvent(
+            event_type="error",
+            data={"error": str(error)},
+            timestamp=datetime.now(),
+        )
@@ -0,0 +1,76 @@
+"""Local pre-classification of agent queries, run before the graph is invoked."""
+import re
+from enum import Enum
+
+
+class QueryRoute(str, Enum):
+    """How a query is answered."""
+
+    DIRECT = "direct"  # Answered with a canned response, no model call
+    GRAPH = "graph"  # Needs the full agent graph
+    REJECT = "reject"  # Refused with a policy message, no model call
+
+
+_GREETING = re.compile(
+    r"(hi|hello|hey|hiya|howdy|good (morning|afternoon|evening)"
+    r"|thanks|thank you|thank you very much|thx|ty|cheers"
+    r"|bye|goodbye|see you|ok|okay|cool|great)"
+    r"( there| agent| so much)?[\s!.,?]*",
+    re.IGNORECASE,
+)
+_FAREWELL = re.compile(r"(thanks|thank you|thx|ty|cheers|bye|goodbye|see you)", re.IGNORECASE)
+_NO_CONTENT = re.compile(r"[\W_]*")
+_PROMPT_INJECTION = re.compile(
+    r"\b(ignore|disregard|forget) (all |any )?(the )?(previous|prior|above|earlier) "
+    r"(instructions|prompts?|rules)\b"
+    r"|\b(reveal|print|show|repeat) (me )?(your|the) (system )?prompt\b",
+    re.IGNORECASE,
+)
+
+GREETING_ANSWER = (
+    "Hello! I can look up current and historical stock prices and answer questions "
+    "about Amazon's financial reports. What would you like to know?"
+)
+FAREWELL_ANSWER = "You're welcome! Ask me anytime about stock prices or Amazon's financials."
+REJECT_ANSWER = (
+    "I can't help with that request. I can answer questions about stock prices "
+    "and Amazon's financial reports."
+)
+
+
+def classify_query(query: str) -> QueryRoute:
+    """
+    Classify a query using only local checks (no model or network calls).
+
+    Args:
+        query: User's natural language query
+
+    Returns:
+        DIRECT for small talk, REJECT for contentless or prompt-injection input,
+        GRAPH for everything else
+    """
+    text = query.strip()
+    if _NO_CONTENT.fullmatch(text):
+        return QueryRoute.REJECT
+    if _PROMPT_INJECTION.search(text):
+        return QueryRoute.REJECT
+    # Greetings are short; skip the regex for anything that could be a real question
+    if len(text) <= 40 and _GREETING.fullmatch(text):
+        return QueryRoute.DIRECT
+    return QueryRoute.GRAPH
+
+
+def direct_answer(query: str, route: QueryRoute) -> str:
+    """
+    Get the canned answer for a query that does not need the agent graph.
+
+    Args:
+        query: User's natural language query
+        route: Route returned by classify_query (DIRECT or REJECT)
+
+    Returns:
+        Canned answer text
+    """
+    if route is QueryRoute.REJECT:
+        return REJECT_ANSWER
+    return FAREWELL_ANSWER if _FAREWELL.match(query.strip()) else GREETING_ANSWER
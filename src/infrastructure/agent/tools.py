@@ -1,6 +1,8 @@
 """LangGraph tools for the AI agent."""
-from datetime import datetime, timedelta
-from typing import Any
+import asyncio
+from contextvars import ContextVar
+from datetime import date, datetime, time
+from typing import Any, Awaitable
 
 from langchain_core.tools import tool
 
@@ -12,6 +14,23 @@ from src.application.use_cases.get_realtime_stock_price import (
 )
 from src.application.use_cases.query_documents import QueryDocumentsUseCase
 
+# Speculative tool results for the current request, keyed by (tool, *args).
+# Set by AgentTools.prefetch; LangGraph nodes inherit it through the task context.
+_prefetched: ContextVar[dict[tuple, asyncio.Future] | None] = ContextVar(
+    "agent_tools_prefetched", default=None
+)
+
+PREFETCH_MAX_RESULTS = 5
+
+NO_DOCUMENTS_FOUND = "No relevant information found in financial documents."
+# Tool results starting with these are final: another LLM turn cannot add to them
+TERMINAL_RESULT_PREFIXES = (NO_DOCUMENTS_FOUND, "Error ")
+
+
+def _parse_date(value: str) -> datetime:
+    """Parse a YYYY-MM-DD date to midnight (C-level fromisoformat, unlike strptime)."""
+    return datetime.combine(date.fromisoformat(value), time.min)
+
 
 class AgentTools:
     """Factory for creating agent tools with dependency injection."""
@@ -33,14 +52,70 @@ class AgentTools:
         self._get_realtime_price_uc = get_realtime_price_uc
         self._get_historical_price_uc = get_historical_price_uc
         self._query_documents_uc = query_documents_uc
+        # Bounds speculative calls so prefetching cannot trip yfinance/Bedrock rate limits
+        self._prefetch_semaphore = asyncio.Semaphore(4)
+        self._tools: list[Any] | None = None
+
+    def prefetch(self, query: str | None = None, symbol: str | None = None) -> asyncio.Future:
+        """
+        Start fetching likely tool results for the current request in the background.
+
+        Tools called later in the same request reuse these results instead of
+        calling the use cases again, so independent lookups overlap with LLM planning.
+
+        Args:
+            query: Document search query to prefetch, if any
+            symbol: Stock ticker symbol whose realtime price to prefetch, if any
+
+        Returns:
+            Future resolving once all prefetches finish (exceptions are returned, not raised)
+        """
+        prefetched: dict[tuple, asyncio.Future] = {}
+        _prefetched.set(prefetched)
+
+        if symbol:
+            prefetched[("price", symbol.strip().upper())] = asyncio.ensure_future(
+                self._bounded(self._get_realtime_price_uc.execute(symbol))
+            )
+        if query:
+            prefetched[("documents", query, PREFETCH_MAX_RESULTS)] = asyncio.ensure_future(
+                self._bounded(self._query_documents_uc.execute(query, PREFETCH_MAX_RESULTS))
+            )
+
+        return asyncio.gather(*prefetched.values(), return_exceptions=True)
+
+    async def _bounded(self, awaitable: Awaitable[Any]) -> Any:
+        """Run a prefetch under the concurrency limit."""
+        async with self._prefetch_semaphore:
+            return await awaitable
+
+    @staticmethod
+    async def _take_prefetched(key: tuple) -> Any | None:
+        """Return a successful prefetched result for key, or None to call through."""
+        prefetched = _prefetched.get()
+        future = prefetched.pop(key, None) if prefetched else None
+        if future is None:
+            return None
+        try:
+            return await future
+        except Exception:
+            return None
 
     def create_tools(self) -> list[Any]:
         """
         Create all tools for the agent.
 
+        The tools are built on the first call and the same list is returned afterwards.
+
         Returns:
             List of LangChain tools
         """
+        if self._tools is None:
+            self._tools = self._build_tools()
+        return self._tools
+
+    def _build_tools(self) -> list[Any]:
+        """Define the LangChain tools bound to this instance's use cases."""
 
         @tool
         async def retrieve_realtime_stock_price(symbol: str) -> str:
@@ -54,7 +129,9 @@ class AgentTools:
                 Current stock price and related information
             """
             try:
-                price = await self._get_realtime_price_uc.execute(symbol)
+                price = await self._take_prefetched(("price", symbol.strip().upper()))
+                if price is None:
+                    price = await self._get_realtime_price_uc.execute(symbol)
 
                 day_high = (
                     f"${price.day_high:.2f}" if price.day_high is not None else "N/A"
@@ -104,8 +181,8 @@ class AgentTools:
             """
             try:
                 # Parse dates
-                start = datetime.strptime(start_date, "%Y-%m-%d")
-                end = datetime.strptime(end_date, "%Y-%m-%d")
+                start = _parse_date(start_date)
+                end = _parse_date(end_date)
 
                 # Get historical data
                 hist_prices = await self._get_historical_price_uc.execute(
@@ -113,7 +190,7 @@ class AgentTools:
                 )
 
                 # Format response
-                result = (
+                header = (
                     f"Historical Stock Prices for {hist_prices.symbol}\n"
                     f"Period: {hist_prices.start_date.date()} to {hist_prices.end_date.date()}\n"
                     f"Granularity: {hist_prices.period}\n"
@@ -126,12 +203,10 @@ class AgentTools:
                 )
 
                 # Add last 5 prices
-                for price in hist_prices.prices[-5:]:
-                    result += (
-                        f"  {price.timestamp.date()}: ${price.price:.2f}\n"
-                    )
-
-                return result
+                return header + "".join(
+                    f"  {price.timestamp.date()}: ${price.price:.2f}\n"
+                    for price in hist_prices.prices[-5:]
+                )
 
             except Exception as e:
                 return (
@@ -151,20 +226,17 @@ class AgentTools:
                 Relevant excerpts from financial documents
             """
             try:
-                chunks = await self._query_documents_uc.execute(query, max_results)
+                chunks = await self._take_prefetched(("documents", query, max_results))
+                if chunks is None:
+                    chunks = await self._query_documents_uc.execute(query, max_results)
 
                 if not chunks:
-                    return "No relevant information found in financial documents."
-
-                result = f"Found {len(chunks)} relevant document sections:\n\n"
+                    return NO_DOCUMENTS_FOUND
 
-                for idx, chunk in enumerate(chunks, 1):
-                    result += (
-                        f"[{idx}] (Relevance: {chunk.relevance_score:.2f})\n"
-                        f"{chunk.content}\n\n"
-                    )
-
-                return result
+                return f"Found {len(chunks)} relevant document sections:\n\n" + "".join(
+                    f"[{idx}] (Relevance: {chunk.relevance_score:.2f})\n{chunk.content}\n\n"
+                    for idx, chunk in enumerate(chunks, 1)
+                )
 
             except Exception as e:
                 return f"Error searching financial documents: {str(e)}"
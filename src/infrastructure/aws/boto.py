@@ -0,0 +1,30 @@
+"""Shared botocore client configuration for AWS-backed services."""
+from typing import Any
+
+from botocore.config import Config
+
+# Matches the thread pool FastAPI runs sync work on, so concurrent requests don't
+# queue on botocore's default pool of 10 connections
+MAX_POOL_CONNECTIONS = 50
+# Adaptive mode adds client-side rate limiting on top of retries, absorbing
+# Cognito and Bedrock throttling bursts
+DEFAULT_RETRIES = {"max_attempts": 10, "mode": "adaptive"}
+
+
+def default_config(region: str, **overrides: Any) -> Config:
+    """
+    Build the client configuration shared by all AWS clients.
+
+    Args:
+        region: AWS region for the client
+        **overrides: Extra Config options (e.g. read_timeout) taking precedence
+
+    Returns:
+        botocore Config with a pooled, keep-alive connection setup and adaptive retries
+    """
+    return Config(
+        region_name=region,
+        max_pool_connections=MAX_POOL_CONNECTIONS,
+        tcp_keepalive=True,
+        retries=DEFAULT_RETRIES,
+    ).merge(Config(**overrides))
@@ -1,15 +1,28 @@
 """AWS Cognito authentication service."""
+import asyncio
+import time
 from typing import Any
 
 import boto3
-from botocore.config import Config
+import httpx
 from jose import JWTError, jwt
-from jose.backends import RSAKey
+# Import the cryptography backend explicitly: jose.backends.RSAKey silently falls back to
+# slower pure-Python/pycryptodome verifiers when cryptography is not installed
+from jose.backends.cryptography_backend import CryptographyRSAKey
+from jose.constants import ALGORITHMS
 
+from src.infrastructure.aws.boto import default_config
 from src.infrastructure.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Cognito rotates signing keys rarely; refetch the key set at most this often
+JWKS_TTL_SECONDS = 3600.0
+# An unknown key ID triggers an early refetch, but no more often than this
+JWKS_MIN_REFRESH_SECONDS = 60.0
+# Cognito tokens are a few KiB; anything far larger is rejected before parsing
+MAX_TOKEN_LENGTH = 16 * 1024
+
 
 class CognitoAuthService:
     """Service for AWS Cognito authentication and token validation."""
@@ -19,6 +32,7 @@ class CognitoAuthService:
         user_pool_id: str,
         app_client_id: str,
         region: str = "us-east-2",
+        session: boto3.Session | None = None,
     ) -> None:
         """
         Initialize Cognito auth service.
@@ -27,17 +41,22 @@ class CognitoAuthService:
             user_pool_id: Cognito user pool ID
             app_client_id: Cognito app client ID
             region: AWS region
+            session: Optional shared boto3 session to create the client from
         """
         self._user_pool_id = user_pool_id
         self._app_client_id = app_client_id
         self._region = region
         self._issuer = f"https://cognito-idp.{region}.amazonaws.com/{user_pool_id}"
 
-        config = Config(region_name=region)
-        self._cognito_client = boto3.client("cognito-idp", config=config)
+        config = default_config(region)
+        client_factory = session.client if session is not None else boto3.client
+        self._cognito_client = client_factory("cognito-idp", config=config)
 
-        # Cache for JWKS (JSON Web Key Set)
-        self._jwks: dict[str, Any] | None = None
+        # Public keys from the JWKS (JSON Web Key Set), parsed once and indexed by key ID
+        self._keys_by_kid: dict[str, CryptographyRSAKey] = {}
+        self._jwks_fetched_at: float | None = None
+        # Serializes refetches so concurrent requests share one JWKS download
+        self._jwks_lock = asyncio.Lock()
 
         logger.info(
             "Cognito auth service initialized",
@@ -48,24 +67,61 @@ class CognitoAuthService:
             },
         )
 
-    def _get_jwks(self) -> dict[str, Any]:
-        """Fetch and cache JSON Web Key Set from Cognito."""
-        if self._jwks is None:
-            import requests
-
-            jwks_url = f"{self._issuer}/.well-known/jwks.json"
-            logger.info("Fetching JWKS from Cognito", extra={"jwks_url": jwks_url})
-
+    async def _get_signing_key(self, kid: str) -> CryptographyRSAKey | None:
+        """Look up a public key by ID, fetching the key set when stale or missing the key."""
+        key = self._keys_by_kid.get(kid)
+        if key is not None and not self._jwks_expired(JWKS_TTL_SECONDS):
+            return key
+
+        async with self._jwks_lock:
+            # Another request may have refreshed the keys while this one waited
+            key = self._keys_by_kid.get(kid)
+            if key is not None and not self._jwks_expired(JWKS_TTL_SECONDS):
+                return key
+            if key is None and not self._jwks_expired(JWKS_MIN_REFRESH_SECONDS):
+                return None
+
+            self._keys_by_kid = self._parse_jwks(await self._fetch_jwks())
+            self._jwks_fetched_at = time.monotonic()
+
+        return self._keys_by_kid.get(kid)
+
+    @staticmethod
+    def _parse_jwks(jwks: dict[str, Any]) -> dict[str, CryptographyRSAKey]:
+        """Construct RSA public keys so tokens are verified without re-parsing the JWK."""
+        keys: dict[str, CryptographyRSAKey] = {}
+        for jwk in jwks.get("keys", []):
+            kid = jwk.get("kid")
+            if not kid:
+                continue
             try:
-                response = requests.get(jwks_url, timeout=10)
-                response.raise_for_status()
-                self._jwks = response.json()
-                logger.info("JWKS fetched successfully", extra={"key_count": len(self._jwks.get("keys", []))})
+                keys[kid] = CryptographyRSAKey(jwk, ALGORITHMS.RS256)
             except Exception as e:
-                logger.error("Failed to fetch JWKS", extra={"error": str(e), "jwks_url": jwks_url})
-                raise
+                logger.warning("Skipping unusable JWKS key", extra={"kid": kid, "error": str(e)})
+        return keys
+
+    def _jwks_expired(self, max_age_seconds: float) -> bool:
+        """Whether the cached key set is missing or older than max_age_seconds."""
+        return (
+            self._jwks_fetched_at is None
+            or time.monotonic() - self._jwks_fetched_at >= max_age_seconds
+        )
 
-        return self._jwks
+    async def _fetch_jwks(self) -> dict[str, Any]:
+        """Fetch the JSON Web Key Set from Cognito."""
+        jwks_url = f"{self._issuer}/.well-known/jwks.json"
+        logger.info("Fetching JWKS from Cognito", extra={"jwks_url": jwks_url})
+
+        try:
+            async with httpx.AsyncClient(timeout=10) as client:
+                response = await client.get(jwks_url)
+                response.raise_for_status()
+                jwks = response.json()
+            logger.info("JWKS fetched successfully", extra={"key_count": len(jwks.get("keys", []))})
+            return jwks
+        except Exception as e:
+            logger.error("Failed to fetch JWKS", extra={"error": str(e), "jwks_url": jwks_url})
+            raise
 
     async def verify_token(self, token: str) -> dict[str, Any]:
         """
@@ -82,11 +138,20 @@ class CognitoAuthService:
         """
         logger.debug("Verifying Cognito token")
 
+        # Only compact JWS tokens are accepted: no JWE (5 segments), no oversized input
+        if len(token) > MAX_TOKEN_LENGTH or token.count(".") != 2:
+            logger.warning("Malformed token rejected", extra={"token_length": len(token)})
+            raise ValueError("Invalid token: malformed JWT")
+
         try:
             # Get the key ID from token headers
             headers = jwt.get_unverified_headers(token)
             kid = headers.get("kid")
 
+            if headers.get("alg") != ALGORITHMS.RS256:
+                logger.warning("Token algorithm rejected", extra={"alg": headers.get("alg")})
+                raise ValueError("Invalid token: unsupported algorithm")
+
             if not kid:
                 logger.warning("Token missing key ID")
                 raise ValueError("Token missing key ID")
@@ -94,13 +159,7 @@ class CognitoAuthService:
             logger.debug("Token key ID found", extra={"kid": kid})
 
             # Find the matching key from JWKS
-            jwks = self._get_jwks()
-            key = None
-            for jwk in jwks.get("keys", []):
-                if jwk.get("kid") == kid:
-                    key = jwk
-                    break
-
+            key = await self._get_signing_key(kid)
             if not key:
                 logger.warning("Public key not found in JWKS", extra={"kid": kid})
                 raise ValueError("Public key not found in JWKS")
@@ -109,7 +168,7 @@ class CognitoAuthService:
             claims = jwt.decode(
                 token,
                 key,
-                algorithms=["RS256"],
+                algorithms=[ALGORITHMS.RS256],
                 audience=self._app_client_id,
                 issuer=self._issuer,
             )
@@ -138,7 +197,8 @@ class CognitoAuthService:
         logger.info("Attempting user authentication", extra={"username": username})
 
         try:
-            response = self._cognito_client.initiate_auth(
+            response = await asyncio.to_thread(
+                self._cognito_client.initiate_auth,
                 ClientId=self._app_client_id,
                 AuthFlow="USER_PASSWORD_AUTH",
                 AuthParameters={"USERNAME": username, "PASSWORD": password},
@@ -182,7 +242,8 @@ class CognitoAuthService:
             RuntimeError: If user creation fails
         """
         try:
-            response = self._cognito_client.admin_create_user(
+            response = await asyncio.to_thread(
+                self._cognito_client.admin_create_user,
                 UserPoolId=self._user_pool_id,
                 Username=username,
                 UserAttributes=[{"Name": "email", "Value": email}],
@@ -192,7 +253,8 @@ class CognitoAuthService:
 
             if not temp_password:
                 # Set permanent password
-                self._cognito_client.admin_set_user_password(
+                await asyncio.to_thread(
+                    self._cognito_client.admin_set_user_password,
                     UserPoolId=self._user_pool_id,
                     Username=username,
                     Password=password,
@@ -0,0 +1,204 @@
+"""In-memory semantic cache keyed on query embeddings."""
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+from src.domain.interfaces.llm_service import ILLMService
+from src.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class _Entry:
+    """Cached value with its unit-normalized query embedding."""
+
+    vector: np.ndarray
+    value: Any
+    expires_at: float
+
+
+@dataclass
+class _Namespace:
+    """Entries for one cache namespace, in LRU order."""
+
+    entries: "OrderedDict[str, _Entry]" = field(default_factory=OrderedDict)
+    # Stacked vectors for similarity search, rebuilt lazily after writes
+    matrix: np.ndarray | None = None
+    keys: list[str] = field(default_factory=list)
+
+
+class InMemorySemanticCache:
+    """
+    Semantic cache with an exact-match front and cosine-similarity fallback.
+
+    Exact repeats (after case/whitespace normalization) are served without an
+    embedding call. Paraphrases are matched by cosine similarity against all
+    entries in the namespace, which is a single matrix-vector product at the
+    cache sizes used here. The similarity threshold adapts towards a target
+    hit rate but never drops below ``min_similarity_threshold``.
+    """
+
+    def __init__(
+        self,
+        llm_service: ILLMService,
+        max_entries: int = 1000,
+        ttl_seconds: float = 3600.0,
+        similarity_threshold: float = 0.95,
+        min_similarity_threshold: float = 0.90,
+        target_hit_rate: float = 0.7,
+        adapt_every: int = 50,
+    ) -> None:
+        """
+        Initialize semantic cache.
+
+        Args:
+            llm_service: Service used to embed query text
+            max_entries: Maximum entries per namespace before LRU eviction
+            ttl_seconds: Time-to-live for cached values
+            similarity_threshold: Initial cosine similarity required for a hit
+            min_similarity_threshold: Lower bound for the adaptive threshold
+            target_hit_rate: Hit rate the adaptive threshold steers towards
+            adapt_every: Number of lookups between threshold adjustments
+        """
+        if not 0.0 < min_similarity_threshold <= similarity_threshold <= 1.0:
+            raise ValueError("Similarity thresholds must satisfy 0 < min <= initial <= 1")
+
+        self._llm_service = llm_service
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._initial_threshold = similarity_threshold
+        self._min_threshold = min_similarity_threshold
+        self._target_hit_rate = target_hit_rate
+        self._adapt_every = adapt_every
+
+        self._threshold = similarity_threshold
+        self._namespaces: dict[str, _Namespace] = {}
+        # Embeddings computed on a miss, reused by the subsequent set()
+        self._pending: "OrderedDict[tuple[str, str], np.ndarray]" = OrderedDict()
+        self._window_lookups = 0
+        self._window_hits = 0
+
+    @property
+    def similarity_threshold(self) -> float:
+        """Current cosine similarity threshold."""
+        return self._threshold
+
+    async def get(self, namespace: str, query: str) -> Any | None:
+        """Look up a cached value for a query or a semantically similar one."""
+        key = self._normalize(query)
+        bucket = self._namespaces.get(namespace)
+        now = time.monotonic()
+
+        if bucket is not None:
+            entry = bucket.entries.get(key)
+            if entry is not None:
+                if entry.expires_at > now:
+                    bucket.entries.move_to_end(key)
+                    self._record(hit=True)
+                    return entry.value
+                self._evict(bucket, key)
+
+        vector = await self._embed(query)
+        if vector is None:
+            return None
+
+        self._pending[(namespace, key)] = vector
+        if len(self._pending) > self._max_entries:
+            self._pending.popitem(last=False)
+
+        if bucket is None or not bucket.entries:
+            self._record(hit=False)
+            return None
+
+        if bucket.matrix is None:
+            bucket.keys = list(bucket.entries)
+            bucket.matrix = np.vstack([bucket.entries[k].vector for k in bucket.keys])
+
+        scores = bucket.matrix @ vector
+        best = int(np.argmax(scores))
+        match_key = bucket.keys[best]
+        match = bucket.entries[match_key]
+
+        if scores[best] >= self._threshold and match.expires_at > now:
+            bucket.entries.move_to_end(match_key)
+            self._record(hit=True)
+            logger.info(
+                "Semantic cache hit",
+                extra={"namespace": namespace, "similarity": round(float(scores[best]), 4)},
+            )
+            return match.value
+
+        self._record(hit=False)
+        return None
+
+    async def set(self, namespace: str, query: str, value: Any) -> None:
+        """Store a value for a query."""
+        key = self._normalize(query)
+        vector = self._pending.pop((namespace, key), None)
+        if vector is None:
+            vector = await self._embed(query)
+            if vector is None:
+                return
+
+        bucket = self._namespaces.setdefault(namespace, _Namespace())
+        bucket.entries[key] = _Entry(
+            vector=vector,
+            value=value,
+            expires_at=time.monotonic() + self._ttl_seconds,
+        )
+        bucket.entries.move_to_end(key)
+        bucket.matrix = None
+
+        while len(bucket.entries) > self._max_entries:
+            oldest = next(iter(bucket.entries))
+            self._evict(bucket, oldest)
+
+    @staticmethod
+    def _normalize(query: str) -> str:
+        """Normalize case and whitespace for exact-match lookups."""
+        return " ".join(query.lower().split())
+
+    @staticmethod
+    def _evict(bucket: _Namespace, key: str) -> None:
+        """Remove an entry and invalidate the similarity matrix."""
+        del bucket.entries[key]
+        bucket.matrix = None
+
+    async def _embed(self, query: str) -> np.ndarray | None:
+        """Embed and unit-normalize a query; None means bypass the cache."""
+        try:
+            embedding = await self._llm_service.embed_text(query)
+        except Exception as e:
+            logger.warning("Semantic cache bypassed, embedding failed", extra={"error": str(e)})
+            return None
+
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        if norm == 0.0:
+            return None
+        return vector / norm
+
+    def _record(self, hit: bool) -> None:
+        """Track hit rate and periodically adjust the similarity threshold."""
+        self._window_lookups += 1
+        self._window_hits += int(hit)
+
+        if self._window_lookups < self._adapt_every:
+            return
+
+        hit_rate = self._window_hits / self._window_lookups
+        if hit_rate < self._target_hit_rate:
+            self._threshold = max(self._min_threshold, self._threshold - 0.005)
+        else:
+            self._threshold = min(self._initial_threshold, self._threshold + 0.005)
+
+        logger.info(
+            "Semantic cache threshold adjusted",
+            extra={"hit_rate": round(hit_rate, 3), "threshold": round(self._threshold, 3)},
+        )
+        self._window_lookups = 0
+        self._window_hits = 0
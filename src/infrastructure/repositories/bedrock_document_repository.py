@@ -2,16 +2,17 @@
 from typing import Any
 
 import boto3
+import numpy as np
 from botocore.config import Config
 
 from src.domain.entities.document import Document, DocumentChunk
-from src.domain.interfaces.document_repository import IDocumentRepository
+from src.infrastructure.aws.boto import default_config
 from src.infrastructure.logging import get_logger
 
 logger = get_logger(__name__)
 
 
-class BedrockDocumentRepository(IDocumentRepository):
+class BedrockDocumentRepository:
     """Repository implementation using AWS Bedrock Knowledge Base."""
 
     def __init__(
@@ -19,6 +20,7 @@ class BedrockDocumentRepository(IDocumentRepository):
         knowledge_base_id: str,
         region: str = "us-east-1",
         boto_config: Config | None = None,
+        session: boto3.Session | None = None,
     ) -> None:
         """
         Initialize repository with Bedrock configuration.
@@ -27,18 +29,15 @@ class BedrockDocumentRepository(IDocumentRepository):
             knowledge_base_id: AWS Bedrock Knowledge Base ID
             region: AWS region
             boto_config: Optional boto3 configuration
+            session: Optional shared boto3 session to create the client from
         """
         self._knowledge_base_id = knowledge_base_id
         self._region = region
 
-        config = boto_config or Config(
-            region_name=region,
-            retries={"max_attempts": 3, "mode": "adaptive"},
-        )
+        config = boto_config or default_config(region)
 
-        self._bedrock_agent_runtime = boto3.client(
-            "bedrock-agent-runtime", config=config
-        )
+        client_factory = session.client if session is not None else boto3.client
+        self._bedrock_agent_runtime = client_factory("bedrock-agent-runtime", config=config)
 
         logger.info(
             "Bedrock document repository initialized",
@@ -75,11 +74,28 @@ class BedrockDocumentRepository(IDocumentRepository):
                 },
             )
 
+            results = response.get("retrievalResults", [])
+
+            # Validate all scores in one vectorized pass; out-of-range or empty results are
+            # dropped instead of failing the whole search
+            scores = np.fromiter(
+                (result.get("score", 0.0) for result in results),
+                dtype=np.float64,
+                count=len(results),
+            )
+            valid = (scores >= 0.0) & (scores <= 1.0)
+            if not valid.all():
+                logger.warning(
+                    "Dropping results with out-of-range relevance scores",
+                    extra={"dropped_count": int((~valid).sum())},
+                )
+
             chunks = []
-            for idx, result in enumerate(response.get("retrievalResults", [])):
+            for idx in np.flatnonzero(valid).tolist():
+                result = results[idx]
                 content = result.get("content", {}).get("text", "")
-                score = result.get("score", 0.0)
-                metadata = result.get("metadata", {})
+                if not content:
+                    continue
 
                 # Extract document location/ID
                 location = result.get("location", {})
@@ -90,8 +106,8 @@ class BedrockDocumentRepository(IDocumentRepository):
                         document_id=doc_id,
                         chunk_id=f"{doc_id}_chunk_{idx}",
                         content=content,
-                        relevance_score=float(score),
-                        metadata=metadata,
+                        relevance_score=float(scores[idx]),
+                        metadata=result.get("metadata", {}),
                     )
                 )
 
@@ -99,7 +115,7 @@ class BedrockDocumentRepository(IDocumentRepository):
                 "Document search completed",
                 extra={
                     "results_count": len(chunks),
-                    "avg_score": sum(c.relevance_score for c in chunks) / len(chunks) if chunks else 0,
+                    "avg_score": float(scores[valid].mean()) if chunks else 0,
                 },
             )
 
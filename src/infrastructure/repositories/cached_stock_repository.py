@@ -0,0 +1,81 @@
+"""Stock repository decorator that briefly caches realtime quotes."""
+import asyncio
+import time
+from collections import OrderedDict
+from datetime import datetime
+
+from src.domain.entities.stock_price import HistoricalStockPrice, StockPrice
+from src.domain.interfaces.stock_repository import IStockRepository
+from src.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class CachedStockRepository:
+    """
+    Stock repository wrapper with a short-lived LRU cache for realtime prices.
+
+    A quote stays fresh for ttl_seconds, and concurrent lookups for the same
+    symbol share one underlying call. Failures are not cached. Historical
+    requests are delegated unchanged.
+    """
+
+    def __init__(
+        self,
+        repository: IStockRepository,
+        ttl_seconds: float = 5.0,
+        max_entries: int = 1024,
+    ) -> None:
+        """
+        Initialize repository decorator.
+
+        Args:
+            repository: Stock repository performing the actual lookups
+            ttl_seconds: How long a fetched quote is served from the cache
+            max_entries: Maximum cached symbols before LRU eviction
+        """
+        self._repository = repository
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        # symbol -> (price, expires_at on the monotonic clock)
+        self._prices: "OrderedDict[str, tuple[StockPrice, float]]" = OrderedDict()
+        self._inflight: dict[str, asyncio.Task] = {}
+
+    async def get_realtime_price(self, symbol: str) -> StockPrice:
+        """Get the realtime price, serving recent quotes from the cache."""
+        cached = self._prices.get(symbol)
+        if cached is not None:
+            if cached[1] > time.monotonic():
+                self._prices.move_to_end(symbol)
+                return cached[0]
+            del self._prices[symbol]
+
+        task = self._inflight.get(symbol)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(symbol))
+            self._inflight[symbol] = task
+            task.add_done_callback(lambda _: self._inflight.pop(symbol, None))
+        else:
+            logger.info("Joining in-flight realtime price lookup", extra={"symbol": symbol})
+
+        # Shield so one cancelled caller does not cancel the lookup for the others
+        return await asyncio.shield(task)
+
+    async def get_historical_prices(
+        self,
+        symbol: str,
+        start_date: datetime,
+        end_date: datetime,
+        period: str = "1d",
+    ) -> HistoricalStockPrice:
+        """Get historical prices from the wrapped repository."""
+        return await self._repository.get_historical_prices(symbol, start_date, end_date, period)
+
+    async def _fetch(self, symbol: str) -> StockPrice:
+        """Fetch a quote from the wrapped repository and cache it."""
+        price = await self._repository.get_realtime_price(symbol)
+        self._prices[symbol] = (price, time.monotonic() + self._ttl_seconds)
+        self._prices.move_to_end(symbol)
+        while len(self._prices) > self._max_entries:
+            self._prices.popitem(last=False)
+        return price
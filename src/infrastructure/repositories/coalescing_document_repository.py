@@ -0,0 +1,86 @@
+"""Document repository decorator that coalesces identical in-flight searches."""
+import asyncio
+import time
+from collections import OrderedDict
+
+from src.domain.entities.document import Document, DocumentChunk
+from src.domain.interfaces.document_repository import IDocumentRepository
+from src.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class CoalescingDocumentRepository:
+    """
+    Single-flight wrapper around a document repository.
+
+    Concurrent searches with the same normalized query and result count share
+    one underlying call instead of each hitting the knowledge base. With a
+    positive result_ttl_seconds, completed results are also reused by later
+    identical searches until they expire.
+    """
+
+    def __init__(
+        self,
+        repository: IDocumentRepository,
+        result_ttl_seconds: float = 0.0,
+        max_entries: int = 1024,
+    ) -> None:
+        """
+        Initialize repository decorator.
+
+        Args:
+            repository: Document repository performing the actual searches
+            result_ttl_seconds: How long completed results are reused (0 disables)
+            max_entries: Maximum cached searches before LRU eviction
+        """
+        self._repository = repository
+        self._result_ttl_seconds = result_ttl_seconds
+        self._max_entries = max_entries
+        self._inflight: dict[tuple[str, int], asyncio.Task] = {}
+        # key -> (chunks, expires_at on the monotonic clock)
+        self._results: "OrderedDict[tuple[str, int], tuple[list[DocumentChunk], float]]" = (
+            OrderedDict()
+        )
+
+    async def search_documents(self, query: str, max_results: int = 5) -> list[DocumentChunk]:
+        """Search documents, reusing a recent result or joining an identical search in flight."""
+        key = (" ".join(query.lower().split()), max_results)
+
+        cached = self._results.get(key)
+        if cached is not None:
+            if cached[1] > time.monotonic():
+                self._results.move_to_end(key)
+                return cached[0]
+            del self._results[key]
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._search(key, query, max_results))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            logger.info("Joining in-flight document search", extra={"query": query})
+
+        # Shield so one cancelled caller does not cancel the search for the others
+        return await asyncio.shield(task)
+
+    async def _search(
+        self, key: tuple[str, int], query: str, max_results: int
+    ) -> list[DocumentChunk]:
+        """Run a search on the wrapped repository and keep the result if caching is on."""
+        chunks = await self._repository.search_documents(query, max_results)
+        if self._result_ttl_seconds > 0:
+            self._results[key] = (chunks, time.monotonic() + self._result_ttl_seconds)
+            self._results.move_to_end(key)
+            while len(self._results) > self._max_entries:
+                self._results.popitem(last=False)
+        return chunks
+
+    async def get_document_by_id(self, document_id: str) -> Document:
+        """Retrieve a document by its ID."""
+        return await self._repository.get_document_by_id(document_id)
+
+    async def list_documents(self, company: str) -> list[Document]:
+        """List all documents for a company."""
+        return await self._repository.list_documents(company)
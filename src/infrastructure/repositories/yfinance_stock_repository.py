@@ -2,23 +2,59 @@
 import asyncio
 from datetime import datetime
 from decimal import Decimal
+from functools import lru_cache
 from typing import Any
 
 import yfinance as yf
 
 from src.domain.entities.stock_price import HistoricalStockPrice, StockPrice
-from src.domain.interfaces.stock_repository import IStockRepository
 from src.infrastructure.logging import get_logger
 
 logger = get_logger(__name__)
 
 
-class YFinanceStockRepository(IStockRepository):
+@lru_cache(maxsize=4096, typed=True)
+def _to_decimal(value: float) -> Decimal:
+    """
+    Convert a float price to Decimal via its shortest repr (e.g. 185.42, not 185.4199...).
+
+    Histories repeat the same tick-rounded prices across Open/High/Low/Close, so
+    memoizing skips most float formatting and Decimal parsing. Decimals are
+    immutable, so sharing instances between entities is safe.
+    """
+    return Decimal(repr(value))
+
+
+def _optional_decimal(value: float | None) -> Decimal | None:
+    """Convert an optional yfinance info field, treating missing or zero as unknown."""
+    return _to_decimal(value) if value else None
+
+
+class YFinanceStockRepository:
     """Repository implementation using yfinance library."""
 
-    def __init__(self) -> None:
-        """Initialize repository."""
-        logger.info("YFinance stock repository initialized")
+    def __init__(self, session: Any | None = None, max_concurrency: int = 8) -> None:
+        """
+        Initialize repository.
+
+        yfinance keeps one process-wide HTTP session (with cookie and crumb) that it
+        reuses across tickers, so connections are already pooled. Requests are bounded
+        here so bursts of agent tool calls stay under Yahoo's rate limits.
+
+        Args:
+            session: Optional curl_cffi/requests session for yfinance to use instead of its own
+            max_concurrency: Maximum concurrent yfinance requests
+        """
+        self._session = session
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        logger.info(
+            "YFinance stock repository initialized",
+            extra={"max_concurrency": max_concurrency},
+        )
+
+    def _ticker(self, symbol: str) -> yf.Ticker:
+        """Create a yfinance Ticker bound to the configured session."""
+        return yf.Ticker(symbol, session=self._session)
 
     async def get_realtime_price(self, symbol: str) -> StockPrice:
         """
@@ -37,9 +73,9 @@ class YFinanceStockRepository(IStockRepository):
         logger.info("Fetching realtime stock price", extra={"symbol": symbol})
 
         try:
-            # Run blocking yfinance call in thread pool
-            ticker = await asyncio.to_thread(yf.Ticker, symbol)
-            info = await asyncio.to_thread(lambda: ticker.info)
+            # Run blocking yfinance call in thread pool (one hop for ticker + info)
+            async with self._semaphore:
+                info = await asyncio.to_thread(lambda: self._ticker(symbol).info)
 
             # Validate data was retrieved
             if not info or "currentPrice" not in info:
@@ -59,17 +95,15 @@ class YFinanceStockRepository(IStockRepository):
 
             return StockPrice(
                 symbol=symbol,
-                price=Decimal(str(current_price)),
+                price=_to_decimal(current_price),
                 timestamp=datetime.now(),
                 currency=info.get("currency", "USD"),
                 volume=info.get("volume"),
-                market_cap=Decimal(str(info["marketCap"])) if info.get("marketCap") else None,
-                day_high=Decimal(str(info["dayHigh"])) if info.get("dayHigh") else None,
-                day_low=Decimal(str(info["dayLow"])) if info.get("dayLow") else None,
-                open_price=Decimal(str(info["open"])) if info.get("open") else None,
-                close_price=(
-                    Decimal(str(info["previousClose"])) if info.get("previousClose") else None
-                ),
+                market_cap=_optional_decimal(info.get("marketCap")),
+                day_high=_optional_decimal(info.get("dayHigh")),
+                day_low=_optional_decimal(info.get("dayLow")),
+                open_price=_optional_decimal(info.get("open")),
+                close_price=_optional_decimal(info.get("previousClose")),
             )
 
         except Exception as e:
@@ -116,17 +150,15 @@ class YFinanceStockRepository(IStockRepository):
         )
 
         try:
-            # Run blocking yfinance call in thread pool
-            ticker = await asyncio.to_thread(yf.Ticker, symbol)
-
-            # Download historical data
-            hist = await asyncio.to_thread(
-                lambda: ticker.history(
-                    start=start_date.strftime("%Y-%m-%d"),
-                    end=end_date.strftime("%Y-%m-%d"),
-                    interval=period,
+            # Download historical data in the thread pool (one hop for ticker + history)
+            async with self._semaphore:
+                hist = await asyncio.to_thread(
+                    lambda: self._ticker(symbol).history(
+                        start=start_date.strftime("%Y-%m-%d"),
+                        end=end_date.strftime("%Y-%m-%d"),
+                        interval=period,
+                    )
                 )
-            )
 
             if hist.empty:
                 logger.error(
@@ -138,22 +170,7 @@ class YFinanceStockRepository(IStockRepository):
                     f"between {start_date} and {end_date}"
                 )
 
-            # Convert DataFrame to list of StockPrice entities
-            prices = []
-            for index, row in hist.iterrows():
-                prices.append(
-                    StockPrice(
-                        symbol=symbol,
-                        price=Decimal(str(row["Close"])),
-                        timestamp=index.to_pydatetime(),
-                        currency="USD",
-                        volume=int(row["Volume"]) if "Volume" in row else None,
-                        day_high=Decimal(str(row["High"])) if "High" in row else None,
-                        day_low=Decimal(str(row["Low"])) if "Low" in row else None,
-                        open_price=Decimal(str(row["Open"])) if "Open" in row else None,
-                        close_price=Decimal(str(row["Close"])),
-                    )
-                )
+            prices = self._to_stock_prices(symbol, hist)
 
             logger.info(
                 "Historical prices fetched successfully",
@@ -179,3 +196,48 @@ class YFinanceStockRepository(IStockRepository):
             raise RuntimeError(
                 f"Failed to retrieve historical prices for {symbol}: {str(e)}"
             )
+
+    @staticmethod
+    def _to_stock_prices(symbol: str, hist: Any) -> list[StockPrice]:
+        """
+        Convert a yfinance history DataFrame to StockPrice entities.
+
+        Reads whole columns once instead of iterrows(), which builds a pandas
+        Series per row.
+
+        Args:
+            symbol: Stock ticker symbol
+            hist: DataFrame indexed by timestamp with Close and optional Open/High/Low/Volume
+
+        Returns:
+            StockPrice entities in index order
+        """
+        rows = len(hist)
+
+        def column(name: str, convert: Any) -> list[Any]:
+            if name not in hist.columns:
+                return [None] * rows
+            return [convert(value) for value in hist[name].tolist()]
+
+        closes = column("Close", _to_decimal)
+        return [
+            StockPrice(
+                symbol=symbol,
+                price=close,
+                timestamp=timestamp,
+                currency="USD",
+                volume=volume,
+                day_high=high,
+                day_low=low,
+                open_price=open_price,
+                close_price=close,
+            )
+            for timestamp, close, volume, high, low, open_price in zip(
+                hist.index.to_pydatetime(),
+                closes,
+                column("Volume", int),
+                column("High", _to_decimal),
+                column("Low", _to_decimal),
+                column("Open", _to_decimal),
+            )
+        ]
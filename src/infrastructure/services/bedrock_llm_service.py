@@ -1,17 +1,24 @@
 """Bedrock LLM service implementation."""
+import asyncio
 import json
 from typing import Any, AsyncIterator
 
 import boto3
 from botocore.config import Config
 
-from src.domain.interfaces.llm_service import ILLMService
+from src.infrastructure.aws.boto import default_config
 from src.infrastructure.logging import get_logger
 
 logger = get_logger(__name__)
 
+EMBEDDING_MODEL_ID = "amazon.titan-embed-text-v1"
 
-class BedrockLLMService(ILLMService):
+# Titan text embeddings take one input per InvokeModel call; this bounds how many
+# calls embed_texts keeps in flight at once.
+EMBED_BATCH_SIZE = 25
+
+
+class BedrockLLMService:
     """LLM service implementation using AWS Bedrock."""
 
     def __init__(
@@ -19,6 +26,7 @@ class BedrockLLMService(ILLMService):
         model_id: str = "us.anthropic.claude-3-5-sonnet-20241022-v2:0",
         region: str = "us-east-1",
         boto_config: Config | None = None,
+        session: boto3.Session | None = None,
     ) -> None:
         """
         Initialize Bedrock LLM service.
@@ -27,17 +35,15 @@ class BedrockLLMService(ILLMService):
             model_id: Bedrock model identifier
             region: AWS region
             boto_config: Optional boto3 configuration
+            session: Optional shared boto3 session to create the client from
         """
         self._model_id = model_id
         self._region = region
 
-        config = boto_config or Config(
-            region_name=region,
-            retries={"max_attempts": 3, "mode": "adaptive"},
-            read_timeout=300,
-        )
+        config = boto_config or default_config(region, read_timeout=300)
 
-        self._bedrock_runtime = boto3.client("bedrock-runtime", config=config)
+        client_factory = session.client if session is not None else boto3.client
+        self._bedrock_runtime = client_factory("bedrock-runtime", config=config)
 
         logger.info(
             "Bedrock LLM service initialized",
@@ -185,23 +191,53 @@ class BedrockLLMService(ILLMService):
             RuntimeError: If embedding fails
         """
         try:
-            # Use Amazon Titan Embeddings model
-            embedding_model_id = "amazon.titan-embed-text-v1"
+            # boto3 is blocking; keep the event loop free while Bedrock responds
+            return await asyncio.to_thread(self._invoke_embedding, text)
+
+        except Exception as e:
+            raise RuntimeError(f"Failed to generate embeddings: {str(e)}")
 
-            request_body = json.dumps({"inputText": text})
+    async def embed_texts(self, texts: list[str]) -> list[list[float]]:
+        """
+        Generate embeddings for several texts using Bedrock Titan Embeddings.
 
-            response = self._bedrock_runtime.invoke_model(
-                modelId=embedding_model_id,
-                body=request_body,
-            )
+        Requests run concurrently in groups of EMBED_BATCH_SIZE, so N texts cost
+        about N / EMBED_BATCH_SIZE round-trips of wall time instead of N.
 
-            response_body = json.loads(response["body"].read())
-            embedding = response_body.get("embedding")
+        Args:
+            texts: Texts to embed
 
-            if not embedding:
-                raise RuntimeError("No embedding in response")
+        Returns:
+            Vector embeddings, in the same order as texts
 
-            return embedding
+        Raises:
+            RuntimeError: If any embedding fails
+        """
+        embeddings: list[list[float]] = []
+        try:
+            for start in range(0, len(texts), EMBED_BATCH_SIZE):
+                batch = texts[start : start + EMBED_BATCH_SIZE]
+                embeddings.extend(
+                    await asyncio.gather(
+                        *(asyncio.to_thread(self._invoke_embedding, text) for text in batch)
+                    )
+                )
+            return embeddings
 
         except Exception as e:
             raise RuntimeError(f"Failed to generate embeddings: {str(e)}")
+
+    def _invoke_embedding(self, text: str) -> list[float]:
+        """Call Titan Embeddings for a single text (blocking)."""
+        response = self._bedrock_runtime.invoke_model(
+            modelId=EMBEDDING_MODEL_ID,
+            body=json.dumps({"inputText": text}),
+        )
+
+        response_body = json.loads(response["body"].read())
+        embedding = response_body.get("embedding")
+
+        if not embedding:
+            raise RuntimeError("No embedding in response")
+
+        return embedding
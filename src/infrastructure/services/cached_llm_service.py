@@ -0,0 +1,111 @@
+"""LLM service decorator that memoizes text embeddings."""
+import hashlib
+from collections import OrderedDict
+from typing import AsyncIterator
+
+from src.domain.interfaces.llm_service import ILLMService
+from src.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class CachedLLMService:
+    """
+    LLM service wrapper with an in-memory LRU cache for embeddings.
+
+    Keys are SHA-256 digests of the embedding model id and the text, so switching
+    embedding models never returns vectors from the previous one. Generation
+    calls are delegated unchanged.
+    """
+
+    def __init__(
+        self,
+        llm_service: ILLMService,
+        embedding_model_id: str,
+        max_entries: int = 10_000,
+    ) -> None:
+        """
+        Initialize service decorator.
+
+        Args:
+            llm_service: LLM service performing the actual calls
+            embedding_model_id: Embedding model the wrapped service uses
+            max_entries: Maximum cached embeddings before LRU eviction
+        """
+        self._llm_service = llm_service
+        self._embedding_model_id = embedding_model_id
+        self._max_entries = max_entries
+        self._embeddings: "OrderedDict[bytes, list[float]]" = OrderedDict()
+
+    async def generate(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        temperature: float = 0.7,
+        max_tokens: int = 2048,
+    ) -> str:
+        """Generate a response from the wrapped LLM service."""
+        return await self._llm_service.generate(prompt, system_prompt, temperature, max_tokens)
+
+    def generate_stream(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        temperature: float = 0.7,
+        max_tokens: int = 2048,
+    ) -> AsyncIterator[str]:
+        """Generate a streaming response from the wrapped LLM service."""
+        return self._llm_service.generate_stream(prompt, system_prompt, temperature, max_tokens)
+
+    async def embed_text(self, text: str) -> list[float]:
+        """Generate embeddings for text, serving repeats from the cache."""
+        key = self._key(text)
+        embedding = self._get(key)
+        if embedding is None:
+            embedding = await self._llm_service.embed_text(text)
+            self._put(key, embedding)
+        return embedding
+
+    async def embed_texts(self, texts: list[str]) -> list[list[float]]:
+        """Generate embeddings for several texts, calling the wrapped service for misses only."""
+        keys = [self._key(text) for text in texts]
+        embeddings = [self._get(key) for key in keys]
+
+        # Deduplicate misses so repeated texts in one batch are embedded once
+        misses = {
+            key: text
+            for key, text, embedding in zip(keys, texts, embeddings)
+            if embedding is None
+        }
+        if misses:
+            fetched = dict(zip(misses, await self._llm_service.embed_texts(list(misses.values()))))
+            for key, embedding in fetched.items():
+                self._put(key, embedding)
+            embeddings = [
+                embedding if embedding is not None else fetched[key]
+                for key, embedding in zip(keys, embeddings)
+            ]
+
+        logger.info(
+            "Embedding batch served",
+            extra={"requested": len(texts), "cache_misses": len(misses)},
+        )
+        return embeddings
+
+    def _key(self, text: str) -> bytes:
+        """Build the cache key for a text under the configured embedding model."""
+        return hashlib.sha256(f"{self._embedding_model_id}\0{text}".encode()).digest()
+
+    def _get(self, key: bytes) -> list[float] | None:
+        """Look up an embedding and mark it as recently used."""
+        embedding = self._embeddings.get(key)
+        if embedding is not None:
+            self._embeddings.move_to_end(key)
+        return embedding
+
+    def _put(self, key: bytes, embedding: list[float]) -> None:
+        """Store an embedding, evicting the least recently used beyond capacity."""
+        self._embeddings[key] = embedding
+        self._embeddings.move_to_end(key)
+        while len(self._embeddings) > self._max_entries:
+            self._embeddings.popitem(last=False)
@@ -7,13 +7,12 @@ from langfuse import Langfuse, get_client, propagate_attributes
 from langfuse.langchain import CallbackHandler
 from opentelemetry.sdk.trace import TracerProvider
 
-from src.domain.interfaces.observability_service import IObservabilityService
 from src.infrastructure.logging import get_logger
 
 logger = get_logger(__name__)
 
 
-class LangfuseObservabilityService(IObservabilityService):
+class LangfuseObservabilityService:
     """Service for Langfuse observability and tracing (v3 SDK).
 
     In v3, Langfuse uses a singleton client pattern:
@@ -5,13 +5,12 @@ from typing import Any, Optional
 
 from langsmith import Client
 
-from src.domain.interfaces.observability_service import IObservabilityService
 from src.infrastructure.logging import get_logger
 
 logger = get_logger(__name__)
 
 
-class LangSmithObservabilityService(IObservabilityService):
+class LangSmithObservabilityService:
     """Service for LangSmith observability and tracing."""
 
     def __init__(
@@ -7,9 +7,9 @@ from datetime import datetime
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 
-from src.di.container import DIContainer
+from src.di.container import get_container
 from src.infrastructure.logging import get_logger
 from src.presentation.api.routes import agent, auth
 from src.presentation.api.schemas.response import ErrorResponse, HealthResponse
@@ -39,8 +39,8 @@ async def lifespan(app: FastAPI):
     )
 
     try:
-        # Initialize DI container
-        container = DIContainer()
+        # Initialize DI container (the same singleton the request handlers resolve)
+        container = get_container()
         app.state.container = container
         logger.info("Application startup completed successfully")
     except Exception as e:
@@ -51,6 +51,7 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Shutting down AWS AI Agent API")
+    await container.aclose()
 
 
 # Create FastAPI application
@@ -185,7 +186,7 @@ async def debug_langfuse():
 
     container = get_container()
     obs = container.observability_service
-    results = {"provider": container.observability_provider}
+    results = {"provider": container.settings.observability_provider}
 
     if obs is None:
         results["error"] = "No observability service configured"
@@ -243,7 +244,7 @@ async def invocations(request: Request):
     Supports both streaming (SSE) and non-streaming responses.
     """
     from src.di.container import get_container
-    from src.presentation.api.schemas.response import AgentStepResponse, QueryResponse
+    from src.presentation.api.schemas.response import render_query_response
     from src.presentation.streaming.event_stream import EventStreamFormatter
 
     body = await request.json()
@@ -272,24 +273,9 @@ async def invocations(request: Request):
         else:
             result = await orchestrator.process_query(prompt, user_id="agentcore-user")
 
-            return QueryResponse(
-                query=result.query,
-                answer=result.answer,
-                reasoning_steps=[
-                    AgentStepResponse(
-                        step_number=step.step_number,
-                        action=step.action,
-                        action_input=step.action_input,
-                        observation=step.observation,
-                        timestamp=step.timestamp,
-                    )
-                    for step in result.reasoning_steps
-                ],
-                sources=result.sources,
-                execution_time_ms=result.execution_time_ms,
-                timestamp=result.timestamp,
-                trace_id=result.trace_id,
-                trace_url=result.trace_url,
+            return Response(
+                content=render_query_response(result),
+                media_type="application/json",
             )
     except Exception as e:
         logger.error(f"Invocation failed: {str(e)}", exc_info=True)
@@ -335,10 +321,10 @@ async def logging_middleware(request: Request, call_next):
     )
 
     # Process request and measure time
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     try:
         response = await call_next(request)
-        process_time = (time.time() - start_time) * 1000  # Convert to ms
+        process_time = (time.perf_counter_ns() - start_ns) / 1e6  # Convert to ms
 
         # Log response
         logger.info(
@@ -359,7 +345,7 @@ async def logging_middleware(request: Request, call_next):
         return response
 
     except Exception as e:
-        process_time = (time.time() - start_time) * 1000
+        process_time = (time.perf_counter_ns() - start_ns) / 1e6
         logger.error(
             "Request failed",
             extra={
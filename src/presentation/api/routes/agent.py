@@ -1,16 +1,14 @@
 """API routes for agent interactions."""
-from datetime import datetime
-
 from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 
 from src.di.container import get_agent_orchestrator
 from src.presentation.api.middleware.auth_middleware import get_user_id
 from src.presentation.api.schemas.request import QueryRequest
 from src.presentation.api.schemas.response import (
-    AgentStepResponse,
     ErrorResponse,
     QueryResponse,
+    render_query_response,
 )
 from src.presentation.streaming.event_stream import EventStreamFormatter
 
@@ -21,7 +19,7 @@ router = APIRouter(prefix="/agent", tags=["agent"])
     "/query",
     response_model=None,
     responses={
-        200: {"description": "Successful query response"},
+        200: {"model": QueryResponse, "description": "Successful query response"},
         400: {"model": ErrorResponse, "description": "Invalid request"},
         401: {"model": ErrorResponse, "description": "Unauthorized"},
         500: {"model": ErrorResponse, "description": "Internal server error"},
@@ -31,7 +29,7 @@ async def query_agent(
     request: QueryRequest,
     user_id: str = Depends(get_user_id),
     orchestrator = Depends(get_agent_orchestrator),
-) -> QueryResponse | StreamingResponse:
+) -> Response:
     """
     Query the AI agent with a natural language question.
 
@@ -61,23 +59,9 @@ async def query_agent(
             # Non-streaming response
             result = await orchestrator.process_query(request.query, user_id)
 
-            return QueryResponse(
-                query=result.query,
-                answer=result.answer,
-                reasoning_steps=[
-                    AgentStepResponse(
-                        step_number=step.step_number,
-                        action=step.action,
-                        action_input=step.action_input,
-                        observation=step.observation,
-                        timestamp=step.timestamp,
-                    )
-                    for step in result.reasoning_steps
-                ],
-                sources=result.sources,
-                execution_time_ms=result.execution_time_ms,
-                timestamp=result.timestamp,
-                trace_id=result.trace_id,
+            return Response(
+                content=render_query_response(result),
+                media_type="application/json",
             )
 
     except ValueError as e:
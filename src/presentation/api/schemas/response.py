@@ -1,8 +1,13 @@
 """Response schemas for the API."""
 from datetime import datetime
+from types import MappingProxyType
+from typing import Any
 
+import orjson
 from pydantic import BaseModel, Field
 
+from src.domain.entities.query_result import QueryResult
+
 
 class AgentStepResponse(BaseModel):
     """Response schema for agent reasoning steps."""
@@ -25,6 +30,31 @@ class QueryResponse(BaseModel):
     timestamp: datetime
     trace_id: str | None = None
     trace_url: str | None = None
+    metadata: dict | None = None
+
+
+def _default(value: Any) -> Any:
+    """Serialize values orjson does not handle natively."""
+    if isinstance(value, MappingProxyType):
+        return dict(value)
+    # Decimal and other tool-provided values in action_input
+    return str(value)
+
+
+def render_query_response(result: QueryResult) -> bytes:
+    """
+    Serialize a QueryResult straight to JSON in the QueryResponse shape.
+
+    orjson encodes the (slotted) domain dataclasses natively, so no intermediate
+    QueryResponse/AgentStepResponse models or dicts are built per response.
+
+    Args:
+        result: Query result from the agent orchestrator
+
+    Returns:
+        JSON-encoded response body
+    """
+    return orjson.dumps(result, default=_default)
 
 
 class AuthResponse(BaseModel):
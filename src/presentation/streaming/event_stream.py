@@ -1,15 +1,25 @@
 """Server-Sent Events streaming for agent responses."""
-import json
+from datetime import datetime
 from typing import Any, AsyncIterator
 
+import orjson
+
 from src.domain.entities.query_result import StreamEvent
 
+_DONE_EVENT = b'data: {"event_type":"done"}\n\n'
+
+
+def _sse(payload: Any) -> bytes:
+    """Serialize a payload as a single SSE data frame."""
+    # orjson handles datetime natively; default=str covers Decimal and other tool values
+    return b"data: " + orjson.dumps(payload, default=str) + b"\n\n"
+
 
 class EventStreamFormatter:
     """Formatter for Server-Sent Events (SSE)."""
 
     @staticmethod
-    def format_event(event: StreamEvent) -> str:
+    def format_event(event: StreamEvent) -> bytes:
         """
         Format a StreamEvent as an SSE message.
 
@@ -17,20 +27,20 @@ class EventStreamFormatter:
             event: StreamEvent to format
 
         Returns:
-            Formatted SSE message string
+            Formatted SSE message bytes
         """
-        data = {
-            "event_type": event.event_type,
-            "data": event.data,
-            "timestamp": event.timestamp.isoformat(),
-        }
-
-        return f"data: {json.dumps(data)}\n\n"
+        return _sse(
+            {
+                "event_type": event.event_type,
+                "data": event.data,
+                "timestamp": event.timestamp,
+            }
+        )
 
     @staticmethod
     async def stream_events(
         events: AsyncIterator[StreamEvent],
-    ) -> AsyncIterator[str]:
+    ) -> AsyncIterator[bytes]:
         """
         Stream events in SSE format.
 
@@ -49,12 +59,12 @@ class EventStreamFormatter:
             error_event = StreamEvent(
                 event_type="error",
                 data={"error": str(e)},
-                timestamp=event.timestamp if 'event' in locals() else None,
+                timestamp=datetime.now(),
             )
             yield EventStreamFormatter.format_event(error_event)
 
     @staticmethod
-    def create_message_event(message: str) -> str:
+    def create_message_event(message: str) -> bytes:
         """
         Create a simple SSE message event.
 
@@ -64,14 +74,14 @@ class EventStreamFormatter:
         Returns:
             Formatted SSE message
         """
-        return f"data: {json.dumps({'message': message})}\n\n"
+        return _sse({"message": message})
 
     @staticmethod
-    def create_done_event() -> str:
+    def create_done_event() -> bytes:
         """
         Create a done event to signal stream completion.
 
         Returns:
             Formatted SSE done message
         """
-        return f"data: {json.dumps({'event_type': 'done'})}\n\n"
+        return _DONE_EVENT
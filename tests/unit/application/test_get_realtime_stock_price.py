@@ -100,6 +100,29 @@ class TestGetRealtimeStockPriceUseCase:
         with pytest.raises(ValueError, match="Stock symbol must be a non-empty string"):
             await use_case.execute(123)  # type: ignore
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("symbol", ["   ", "AMZN; DROP", "A" * 20, "amzn!"])
+    async def test_execute_with_malformed_symbol_raises_error(
+        self, use_case, mock_stock_repository, symbol
+    ):
+        """Test that malformed symbols are rejected before reaching the repository."""
+        with pytest.raises(ValueError, match="Invalid stock symbol format"):
+            await use_case.execute(symbol)
+
+        mock_stock_repository.get_realtime_price.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("symbol", ["BRK-B", "BRK.B", "7203.T", "^GSPC", "GC=F"])
+    async def test_execute_accepts_exchange_and_index_symbols(
+        self, use_case, mock_stock_repository, symbol
+    ):
+        """Test that valid Yahoo Finance symbol shapes pass validation."""
+        # Act
+        await use_case.execute(symbol)
+
+        # Assert
+        mock_stock_repository.get_realtime_price.assert_called_once_with(symbol)
+
     @pytest.mark.asyncio
     async def test_execute_propagates_repository_errors(
         self, use_case, mock_stock_repository
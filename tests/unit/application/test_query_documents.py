@@ -6,6 +6,7 @@ import pytest
 from src.application.use_cases.query_documents import QueryDocumentsUseCase
 from src.domain.entities.document import DocumentChunk
 from src.domain.interfaces.document_repository import IDocumentRepository
+from src.domain.interfaces.semantic_cache import ISemanticCache
 
 
 @pytest.fixture
@@ -142,3 +143,51 @@ class TestQueryDocumentsUseCase:
         # Act & Assert
         with pytest.raises(RuntimeError, match="Search service unavailable"):
             await use_case.execute("test query")
+
+    @pytest.mark.asyncio
+    async def test_execute_returns_cached_chunks_on_cache_hit(self, mock_document_repository):
+        """Test that a semantic cache hit skips the repository."""
+        # Arrange
+        cached_chunks = [
+            DocumentChunk(
+                document_id="doc_1",
+                chunk_id="chunk_1",
+                content="Amazon's AI strategy...",
+                relevance_score=0.95,
+            )
+        ]
+        semantic_cache = Mock(spec=ISemanticCache)
+        semantic_cache.get = AsyncMock(return_value=cached_chunks)
+        mock_document_repository.search_documents = AsyncMock()
+        use_case = QueryDocumentsUseCase(
+            document_repository=mock_document_repository,
+            semantic_cache=semantic_cache,
+        )
+
+        # Act
+        result = await use_case.execute("  Amazon AI strategy  ", max_results=5)
+
+        # Assert
+        assert result == cached_chunks
+        semantic_cache.get.assert_called_once_with("documents:5", "Amazon AI strategy")
+        mock_document_repository.search_documents.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_execute_stores_results_on_cache_miss(self, mock_document_repository):
+        """Test that repository results are written to the semantic cache on a miss."""
+        # Arrange
+        semantic_cache = Mock(spec=ISemanticCache)
+        semantic_cache.get = AsyncMock(return_value=None)
+        semantic_cache.set = AsyncMock()
+        mock_document_repository.search_documents = AsyncMock(return_value=[])
+        use_case = QueryDocumentsUseCase(
+            document_repository=mock_document_repository,
+            semantic_cache=semantic_cache,
+        )
+
+        # Act
+        await use_case.execute("test query", max_results=3)
+
+        # Assert
+        mock_document_repository.search_documents.assert_called_once_with("test query", 3)
+        semantic_cache.set.assert_called_once_with("documents:3", "test query", [])
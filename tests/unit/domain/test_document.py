@@ -191,3 +191,44 @@ class TestDocumentChunk:
             relevance_score=1.0,
         )
         assert chunk_1.relevance_score == 1.0
+
+    def test_document_chunk_uses_slots(self):
+        """Test that chunks carry no per-instance __dict__."""
+        chunk = DocumentChunk(
+            document_id="doc_123",
+            chunk_id="chunk_1",
+            content="Content",
+            relevance_score=0.5,
+        )
+        assert not hasattr(chunk, "__dict__")
+
+    def test_metadata_is_read_only(self):
+        """Test that chunk metadata cannot be mutated after construction."""
+        source = {"company": "Amazon"}
+        chunk = DocumentChunk(
+            document_id="doc_123",
+            chunk_id="chunk_1",
+            content="Content",
+            relevance_score=0.5,
+            metadata=source,
+        )
+
+        source["company"] = "Other"
+
+        assert chunk.metadata == {"company": "Amazon"}
+        with pytest.raises(TypeError):
+            chunk.metadata["company"] = "Other"  # type: ignore[index]
+
+    def test_chunks_of_same_document_share_document_id(self):
+        """Test that document IDs built at runtime are interned."""
+        chunks = [
+            DocumentChunk(
+                document_id="".join(["doc_", str(123)]),
+                chunk_id=f"chunk_{i}",
+                content="Content",
+                relevance_score=0.5,
+            )
+            for i in range(2)
+        ]
+
+        assert chunks[0].document_id is chunks[1].document_id
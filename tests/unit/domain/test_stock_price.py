@@ -83,6 +83,12 @@ class TestStockPrice:
         assert price.close_price == Decimal("185.00")
         assert price.market_cap == Decimal("1900000000000")
 
+    def test_stock_price_uses_slots(self):
+        """Test that prices carry no per-instance __dict__."""
+        price = StockPrice(symbol="AMZN", price=Decimal("185.42"), timestamp=datetime.now())
+
+        assert not hasattr(price, "__dict__")
+
 
 class TestHistoricalStockPrice:
     """Tests for HistoricalStockPrice entity."""
@@ -197,3 +203,23 @@ class TestHistoricalStockPrice:
         )
 
         assert hist.lowest_price == Decimal("180.00")
+
+    def test_price_statistics_are_computed_once(self):
+        """Test that price statistics come from a single cached pass."""
+        now = datetime.now()
+        hist = HistoricalStockPrice(
+            symbol="AMZN",
+            start_date=datetime(2024, 1, 1),
+            end_date=datetime(2024, 1, 31),
+            prices=[
+                StockPrice(symbol="AMZN", price=Decimal("180.00"), timestamp=now),
+                StockPrice(symbol="AMZN", price=Decimal("190.00"), timestamp=now),
+            ],
+            period="1d",
+        )
+
+        stats = hist._price_stats
+
+        assert hist._price_stats is stats
+        assert stats == (Decimal("185.00"), Decimal("190.00"), Decimal("180.00"))
+        assert not hasattr(hist, "__dict__")
@@ -0,0 +1,122 @@
+"""Unit tests for AgentTools."""
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.domain.entities.stock_price import StockPrice
+from src.infrastructure.agent.tools import AgentTools
+
+
+@pytest.mark.unit
+class TestAgentTools:
+    """Unit tests for AgentTools."""
+
+    @pytest.fixture
+    def mock_realtime_uc(self):
+        """Create mock realtime price use case."""
+        mock = Mock()
+        mock.execute = AsyncMock(
+            return_value=StockPrice(
+                symbol="AMZN", price=Decimal("185.50"), timestamp=datetime(2024, 1, 2)
+            )
+        )
+        return mock
+
+    @pytest.fixture
+    def mock_documents_uc(self):
+        """Create mock query documents use case."""
+        mock = Mock()
+        mock.execute = AsyncMock(return_value=[])
+        return mock
+
+    @pytest.fixture
+    def agent_tools(self, mock_realtime_uc, mock_documents_uc):
+        """Create agent tools with mocked use cases."""
+        return AgentTools(
+            get_realtime_price_uc=mock_realtime_uc,
+            get_historical_price_uc=Mock(),
+            query_documents_uc=mock_documents_uc,
+        )
+
+    @pytest.mark.asyncio
+    async def test_prefetch_runs_price_and_documents(
+        self, agent_tools, mock_realtime_uc, mock_documents_uc
+    ):
+        """Test that prefetch fetches price and documents concurrently."""
+        # Act
+        results = await agent_tools.prefetch(query="AWS guidance", symbol="amzn")
+
+        # Assert
+        assert len(results) == 2
+        mock_realtime_uc.execute.assert_called_once_with("amzn")
+        mock_documents_uc.execute.assert_called_once_with("AWS guidance", 5)
+
+    @pytest.mark.asyncio
+    async def test_tool_reuses_prefetched_price(self, agent_tools, mock_realtime_uc):
+        """Test that the realtime price tool reads the prefetched result."""
+        # Arrange
+        price_tool = agent_tools.create_tools()[0]
+        await agent_tools.prefetch(symbol="AMZN")
+
+        # Act
+        result = await price_tool.ainvoke({"symbol": "amzn"})
+
+        # Assert
+        assert "Current Price: $185.50" in result
+        mock_realtime_uc.execute.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_tool_calls_use_case_when_prefetch_failed(
+        self, agent_tools, mock_realtime_uc
+    ):
+        """Test that a failed prefetch falls back to a direct use case call."""
+        # Arrange
+        price_tool = agent_tools.create_tools()[0]
+        price = mock_realtime_uc.execute.return_value
+        mock_realtime_uc.execute.side_effect = [RuntimeError("throttled"), price]
+        await agent_tools.prefetch(symbol="AMZN")
+
+        # Act
+        result = await price_tool.ainvoke({"symbol": "AMZN"})
+
+        # Assert
+        assert "Current Price: $185.50" in result
+        assert mock_realtime_uc.execute.call_count == 2
+
+    def test_create_tools_returns_same_tools(self, agent_tools):
+        """Test that tools are built once per AgentTools instance."""
+        # Act
+        first = agent_tools.create_tools()
+        second = agent_tools.create_tools()
+
+        # Assert
+        assert first is second
+        assert [t.name for t in first] == [
+            "retrieve_realtime_stock_price",
+            "retrieve_historical_stock_price",
+            "search_financial_documents",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_historical_tool_parses_iso_dates(self, agent_tools):
+        """Test that date arguments reach the use case as midnight datetimes."""
+        # Arrange
+        historical_uc = agent_tools._get_historical_price_uc
+        historical_uc.execute = AsyncMock(side_effect=RuntimeError("stop"))
+        history_tool = agent_tools.create_tools()[1]
+
+        # Act
+        await history_tool.ainvoke(
+            {"symbol": "AMZN", "start_date": "2024-01-02", "end_date": "2024-03-31"}
+        )
+        result = await history_tool.ainvoke(
+            {"symbol": "AMZN", "start_date": "01/02/2024", "end_date": "2024-03-31"}
+        )
+
+        # Assert
+        historical_uc.execute.assert_awaited_once_with(
+            "AMZN", datetime(2024, 1, 2), datetime(2024, 3, 31), "1d"
+        )
+        assert result.startswith("Error retrieving historical prices for AMZN")
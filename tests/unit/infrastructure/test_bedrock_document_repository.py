@@ -192,3 +192,46 @@ class TestBedrockDocumentRepository:
         assert len(results) == 2
         assert results[0].content == "Chunk 1"
         assert results[1].content == "Chunk 2"
+
+
+@pytest.mark.unit
+class TestBedrockDocumentRepositoryRetrieve:
+    """Unit tests for BedrockDocumentRepository retrieval result handling."""
+
+    @pytest.fixture
+    def mock_runtime_client(self):
+        """Create mock bedrock-agent-runtime client."""
+        return Mock()
+
+    @pytest.fixture
+    def repository(self, mock_runtime_client):
+        """Create repository with mocked runtime client."""
+        with patch("boto3.client", return_value=mock_runtime_client):
+            return BedrockDocumentRepository(knowledge_base_id="kb-123", region="us-east-1")
+
+    @pytest.mark.asyncio
+    async def test_out_of_range_scores_are_dropped(self, repository, mock_runtime_client):
+        """Test that results with invalid scores are skipped instead of failing the search."""
+        # Arrange
+        mock_runtime_client.retrieve.return_value = {
+            "retrievalResults": [
+                {
+                    "content": {"text": "AWS revenue grew 19%"},
+                    "location": {"s3Location": {"uri": "s3://bucket/q3.pdf"}},
+                    "score": 0.82,
+                },
+                {
+                    "content": {"text": "Malformed result"},
+                    "location": {"s3Location": {"uri": "s3://bucket/bad.pdf"}},
+                    "score": 1.7,
+                },
+            ]
+        }
+
+        # Act
+        results = await repository.search_documents("AWS revenue", max_results=5)
+
+        # Assert
+        assert len(results) == 1
+        assert results[0].document_id == "s3://bucket/q3.pdf"
+        assert results[0].relevance_score == pytest.approx(0.82)
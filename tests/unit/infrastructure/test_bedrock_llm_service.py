@@ -0,0 +1,79 @@
+"""Unit tests for BedrockLLMService."""
+import io
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from src.infrastructure.services.bedrock_llm_service import (
+    EMBED_BATCH_SIZE,
+    BedrockLLMService,
+)
+
+
+@pytest.mark.unit
+class TestBedrockLLMServiceEmbeddings:
+    """Unit tests for BedrockLLMService embeddings."""
+
+    @pytest.fixture
+    def mock_runtime(self):
+        """Create a Bedrock runtime client that embeds text as [len(text)]."""
+        mock = Mock()
+
+        def invoke_model(modelId, body):
+            text = json.loads(body)["inputText"]
+            return {"body": io.BytesIO(json.dumps({"embedding": [float(len(text))]}).encode())}
+
+        mock.invoke_model = Mock(side_effect=invoke_model)
+        return mock
+
+    @pytest.fixture
+    def llm_service(self, mock_runtime):
+        """Create LLM service backed by the mock runtime client."""
+        session = Mock()
+        session.client.return_value = mock_runtime
+        return BedrockLLMService(session=session)
+
+    @pytest.mark.asyncio
+    async def test_embed_texts_preserves_input_order(self, llm_service, mock_runtime):
+        """Test that embeddings come back in input order across batches."""
+        # Arrange
+        texts = ["x" * (i + 1) for i in range(EMBED_BATCH_SIZE + 3)]
+
+        # Act
+        embeddings = await llm_service.embed_texts(texts)
+
+        # Assert
+        assert embeddings == [[float(i + 1)] for i in range(len(texts))]
+        assert mock_runtime.invoke_model.call_count == len(texts)
+
+    @pytest.mark.asyncio
+    async def test_embed_texts_raises_runtime_error_on_failure(self, llm_service, mock_runtime):
+        """Test that a failed embedding fails the whole batch."""
+        # Arrange
+        mock_runtime.invoke_model.side_effect = Exception("ThrottlingException")
+
+        # Act & Assert
+        with pytest.raises(RuntimeError, match="Failed to generate embeddings"):
+            await llm_service.embed_texts(["revenue", "margin"])
+
+
+@pytest.mark.unit
+class TestBedrockLLMServiceClientConfig:
+    """Unit tests for the Bedrock runtime client configuration."""
+
+    def test_client_uses_shared_pooled_config(self):
+        """Test that the client gets the shared pooled config with a long read timeout."""
+        # Arrange
+        session = Mock()
+
+        # Act
+        BedrockLLMService(region="us-west-2", session=session)
+
+        # Assert
+        config = session.client.call_args.kwargs["config"]
+        assert config.region_name == "us-west-2"
+        assert config.max_pool_connections == 50
+        assert config.tcp_keepalive is True
+        assert config.retries == {"max_attempts": 10, "mode": "adaptive"}
+        assert config.read_timeout == 300
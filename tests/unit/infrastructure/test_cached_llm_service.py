@@ -0,0 +1,85 @@
+"""Unit tests for CachedLLMService."""
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.infrastructure.services.cached_llm_service import CachedLLMService
+
+
+@pytest.mark.unit
+class TestCachedLLMService:
+    """Unit tests for CachedLLMService."""
+
+    @pytest.fixture
+    def mock_llm_service(self):
+        """Create mock LLM service that embeds text as [len(text)]."""
+        mock = Mock()
+        mock.embed_text = AsyncMock(side_effect=lambda text: [float(len(text))])
+        mock.embed_texts = AsyncMock(
+            side_effect=lambda texts: [[float(len(text))] for text in texts]
+        )
+        mock.generate = AsyncMock(return_value="answer")
+        return mock
+
+    @pytest.fixture
+    def service(self, mock_llm_service):
+        """Create cached service around the mock."""
+        return CachedLLMService(mock_llm_service, embedding_model_id="amazon.titan-embed-text-v1")
+
+    @pytest.mark.asyncio
+    async def test_embed_text_serves_repeats_from_cache(self, service, mock_llm_service):
+        """Test that a repeated text is embedded only once."""
+        # Act
+        first = await service.embed_text("Amazon revenue")
+        second = await service.embed_text("Amazon revenue")
+
+        # Assert
+        assert first == second == [14.0]
+        mock_llm_service.embed_text.assert_called_once_with("Amazon revenue")
+
+    @pytest.mark.asyncio
+    async def test_embed_texts_fetches_only_misses_in_order(self, service, mock_llm_service):
+        """Test that batch embedding calls the wrapped service for misses only."""
+        # Arrange
+        await service.embed_text("bb")
+
+        # Act
+        embeddings = await service.embed_texts(["a", "bb", "ccc", "a"])
+
+        # Assert
+        assert embeddings == [[1.0], [2.0], [3.0], [1.0]]
+        mock_llm_service.embed_texts.assert_called_once_with(["a", "ccc"])
+
+    def test_cache_is_scoped_to_embedding_model(self, mock_llm_service):
+        """Test that services for different embedding models do not share keys."""
+        # Arrange
+        titan = CachedLLMService(mock_llm_service, embedding_model_id="titan")
+        cohere = CachedLLMService(mock_llm_service, embedding_model_id="cohere")
+
+        # Assert
+        assert titan._key("revenue") != cohere._key("revenue")
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_embedding_is_evicted(self, mock_llm_service):
+        """Test that the cache stays within max_entries."""
+        # Arrange
+        service = CachedLLMService(mock_llm_service, embedding_model_id="titan", max_entries=2)
+
+        # Act
+        embeddings = await service.embed_texts(["a", "bb", "ccc"])
+        await service.embed_text("a")
+
+        # Assert
+        assert embeddings == [[1.0], [2.0], [3.0]]
+        assert len(service._embeddings) == 2
+        assert mock_llm_service.embed_text.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_generate_is_delegated(self, service, mock_llm_service):
+        """Test that generation calls pass through unchanged."""
+        # Act
+        result = await service.generate("prompt", "system")
+
+        # Assert
+        assert result == "answer"
+        mock_llm_service.generate.assert_called_once_with("prompt", "system", 0.7, 2048)
@@ -0,0 +1,109 @@
+"""Unit tests for CachedStockRepository."""
+import asyncio
+import time
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from src.domain.entities.stock_price import StockPrice
+from src.domain.interfaces.stock_repository import IStockRepository
+from src.infrastructure.repositories.cached_stock_repository import CachedStockRepository
+
+MONOTONIC_PATH = "src.infrastructure.repositories.cached_stock_repository.time.monotonic"
+
+
+@pytest.mark.unit
+class TestCachedStockRepository:
+    """Unit tests for CachedStockRepository."""
+
+    @pytest.fixture
+    def price(self):
+        """Create a sample realtime quote."""
+        return StockPrice(symbol="AMZN", price=Decimal("185.42"), timestamp=datetime.now())
+
+    @pytest.fixture
+    def mock_repository(self, price):
+        """Create slow mock repository so lookups overlap."""
+
+        async def get_realtime_price(symbol):
+            await asyncio.sleep(0.01)
+            return price
+
+        mock = Mock(spec=IStockRepository)
+        mock.get_realtime_price = AsyncMock(side_effect=get_realtime_price)
+        return mock
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_share_one_call(self, mock_repository, price):
+        """Test that concurrent lookups for a symbol hit the repository once."""
+        # Arrange
+        repository = CachedStockRepository(mock_repository)
+
+        # Act
+        results = await asyncio.gather(*(repository.get_realtime_price("AMZN") for _ in range(5)))
+
+        # Assert
+        assert results == [price] * 5
+        mock_repository.get_realtime_price.assert_called_once_with("AMZN")
+
+    @pytest.mark.asyncio
+    async def test_quote_is_served_from_cache_until_ttl(self, mock_repository):
+        """Test that a quote is reused within the TTL and refetched after it."""
+        # Arrange
+        repository = CachedStockRepository(mock_repository, ttl_seconds=5)
+
+        # Act
+        await repository.get_realtime_price("AMZN")
+        await repository.get_realtime_price("AMZN")
+        with patch(MONOTONIC_PATH, return_value=time.monotonic() + 6):
+            await repository.get_realtime_price("AMZN")
+
+        # Assert
+        assert mock_repository.get_realtime_price.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failures_are_not_cached(self, mock_repository, price):
+        """Test that a failed lookup is retried by the next caller."""
+        # Arrange
+        mock_repository.get_realtime_price = AsyncMock(
+            side_effect=[RuntimeError("Yahoo unavailable"), price]
+        )
+        repository = CachedStockRepository(mock_repository)
+
+        # Act
+        with pytest.raises(RuntimeError, match="Yahoo unavailable"):
+            await repository.get_realtime_price("AMZN")
+        result = await repository.get_realtime_price("AMZN")
+
+        # Assert
+        assert result == price
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_symbol_is_evicted(self, mock_repository):
+        """Test that the cache keeps at most max_entries symbols."""
+        # Arrange
+        repository = CachedStockRepository(mock_repository, max_entries=2)
+
+        # Act
+        for symbol in ("AMZN", "MSFT", "AMZN", "GOOG"):
+            await repository.get_realtime_price(symbol)
+
+        # Assert
+        assert list(repository._prices) == ["AMZN", "GOOG"]
+
+    @pytest.mark.asyncio
+    async def test_historical_prices_are_delegated(self, mock_repository):
+        """Test that historical requests bypass the cache."""
+        # Arrange
+        mock_repository.get_historical_prices = AsyncMock(return_value="history")
+        repository = CachedStockRepository(mock_repository)
+        start, end = datetime(2024, 1, 1), datetime(2024, 2, 1)
+
+        # Act
+        result = await repository.get_historical_prices("AMZN", start, end, "1wk")
+
+        # Assert
+        assert result == "history"
+        mock_repository.get_historical_prices.assert_called_once_with("AMZN", start, end, "1wk")
@@ -0,0 +1,117 @@
+"""Unit tests for CoalescingDocumentRepository."""
+import asyncio
+import time
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from src.domain.entities.document import DocumentChunk
+from src.domain.interfaces.document_repository import IDocumentRepository
+from src.infrastructure.repositories.coalescing_document_repository import (
+    CoalescingDocumentRepository,
+)
+
+MONOTONIC_PATH = "src.infrastructure.repositories.coalescing_document_repository.time.monotonic"
+
+
+@pytest.mark.unit
+class TestCoalescingDocumentRepository:
+    """Unit tests for CoalescingDocumentRepository."""
+
+    @pytest.fixture
+    def chunks(self):
+        """Create sample search results."""
+        return [
+            DocumentChunk(
+                document_id="doc_1",
+                chunk_id="chunk_1",
+                content="AWS revenue grew 19%",
+                relevance_score=0.9,
+            )
+        ]
+
+    @pytest.fixture
+    def mock_repository(self, chunks):
+        """Create slow mock repository so searches overlap."""
+
+        async def search(query, max_results):
+            await asyncio.sleep(0.01)
+            return chunks
+
+        mock = Mock(spec=IDocumentRepository)
+        mock.search_documents = AsyncMock(side_effect=search)
+        return mock
+
+    @pytest.mark.asyncio
+    async def test_identical_concurrent_searches_share_one_call(
+        self, mock_repository, chunks
+    ):
+        """Test that concurrent identical queries hit the repository once."""
+        # Arrange
+        repository = CoalescingDocumentRepository(mock_repository)
+
+        # Act
+        results = await asyncio.gather(
+            repository.search_documents("AWS revenue", 5),
+            repository.search_documents("  aws REVENUE ", 5),
+        )
+
+        # Assert
+        assert results == [chunks, chunks]
+        mock_repository.search_documents.assert_called_once_with("AWS revenue", 5)
+
+    @pytest.mark.asyncio
+    async def test_different_max_results_are_not_coalesced(self, mock_repository):
+        """Test that searches with different result counts run separately."""
+        # Arrange
+        repository = CoalescingDocumentRepository(mock_repository)
+
+        # Act
+        await asyncio.gather(
+            repository.search_documents("AWS revenue", 5),
+            repository.search_documents("AWS revenue", 10),
+        )
+
+        # Assert
+        assert mock_repository.search_documents.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_sequential_searches_are_not_cached(self, mock_repository):
+        """Test that a completed search is not reused by later calls."""
+        # Arrange
+        repository = CoalescingDocumentRepository(mock_repository)
+
+        # Act
+        await repository.search_documents("AWS revenue", 5)
+        await repository.search_documents("AWS revenue", 5)
+
+        # Assert
+        assert mock_repository.search_documents.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_sequential_searches_reuse_result_within_ttl(self, mock_repository, chunks):
+        """Test that a completed search is reused while its result is fresh."""
+        # Arrange
+        repository = CoalescingDocumentRepository(mock_repository, result_ttl_seconds=60)
+
+        # Act
+        first = await repository.search_documents("AWS revenue", 5)
+        second = await repository.search_documents("aws revenue", 5)
+
+        # Assert
+        assert first == second == chunks
+        mock_repository.search_documents.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_expired_result_is_refetched(self, mock_repository):
+        """Test that results older than the TTL trigger a new search."""
+        # Arrange
+        repository = CoalescingDocumentRepository(mock_repository, result_ttl_seconds=60)
+        await repository.search_documents("AWS revenue", 5)
+
+        # Act
+        with patch(MONOTONIC_PATH, return_value=time.monotonic() + 61):
+            await repository.search_documents("AWS revenue", 5)
+
+        # Assert
+        assert mock_repository.search_documents.call_count == 2
@@ -0,0 +1,170 @@
+"""Unit tests for CognitoAuthService JWKS handling."""
+import asyncio
+import threading
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import jwk, jwt
+
+from src.infrastructure.aws.cognito_auth import JWKS_TTL_SECONDS, CognitoAuthService
+
+ISSUER = "https://cognito-idp.us-east-2.amazonaws.com/us-east-2_ABC123"
+
+
+def _private_pem() -> bytes:
+    """Generate a throwaway RSA private key in PEM format."""
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    return key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+
+
+PRIVATE_PEM = _private_pem()
+
+
+def _public_jwk(kid: str) -> dict:
+    """Build the public JWK Cognito would publish for PRIVATE_PEM."""
+    public = jwk.construct(PRIVATE_PEM, "RS256").public_key().to_dict()
+    return {**public, "kid": kid, "use": "sig"}
+
+
+JWKS = {"keys": [_public_jwk("key-1"), _public_jwk("key-2"), {"kid": "bad", "kty": "RSA"}]}
+
+
+@pytest.mark.unit
+class TestCognitoAuthServiceJwks:
+    """Unit tests for signing key lookup."""
+
+    @pytest.fixture
+    def auth_service(self):
+        """Create auth service with a mocked Cognito client and JWKS fetch."""
+        with patch("src.infrastructure.aws.cognito_auth.boto3.client"):
+            service = CognitoAuthService(
+                user_pool_id="us-east-2_ABC123",
+                app_client_id="client123",
+            )
+        service._fetch_jwks = AsyncMock(return_value=JWKS)
+        return service
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_fetch_jwks_once(self, auth_service):
+        """Test that concurrent cold-start lookups share one JWKS download."""
+        # Act
+        keys = await asyncio.gather(
+            auth_service._get_signing_key("key-1"),
+            auth_service._get_signing_key("key-2"),
+        )
+
+        # Assert
+        assert all(key is not None for key in keys)
+        auth_service._fetch_jwks.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_unknown_kid_does_not_refetch_recent_jwks(self, auth_service):
+        """Test that unknown key IDs cannot force a JWKS download per request."""
+        # Arrange
+        await auth_service._get_signing_key("key-1")
+
+        # Act
+        key = await auth_service._get_signing_key("rotated-key")
+
+        # Assert
+        assert key is None
+        auth_service._fetch_jwks.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_jwks_refetched_after_ttl(self, auth_service):
+        """Test that the cached key set expires."""
+        # Arrange
+        await auth_service._get_signing_key("key-1")
+        auth_service._jwks_fetched_at -= JWKS_TTL_SECONDS
+
+        # Act
+        await auth_service._get_signing_key("key-1")
+
+        # Assert
+        assert auth_service._fetch_jwks.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_verify_token_uses_parsed_key(self, auth_service):
+        """Test that tokens verify against the cached key object."""
+        # Arrange
+        token = jwt.encode(
+            {"sub": "user-1", "aud": "client123", "iss": ISSUER, "exp": time.time() + 60},
+            PRIVATE_PEM,
+            algorithm="RS256",
+            headers={"kid": "key-1"},
+        )
+
+        # Act
+        claims = await auth_service.verify_token(token)
+        await auth_service.verify_token(token)
+
+        # Assert
+        assert claims["sub"] == "user-1"
+        assert "bad" not in auth_service._keys_by_kid
+        auth_service._fetch_jwks.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "token",
+        ["a.b.c.d.e", "not-a-jwt", "a." + "b" * 20_000 + ".c"],
+        ids=["jwe", "not-jwt", "oversized"],
+    )
+    async def test_verify_token_rejects_malformed_tokens(self, auth_service, token):
+        """Test that JWE, non-JWT and oversized input are rejected before parsing."""
+        with pytest.raises(ValueError, match="malformed JWT"):
+            await auth_service.verify_token(token)
+
+        auth_service._fetch_jwks.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_verify_token_rejects_non_rs256_tokens(self, auth_service):
+        """Test that tokens signed with another algorithm are rejected."""
+        # Arrange
+        token = jwt.encode({"sub": "user-1"}, "secret", algorithm="HS256", headers={"kid": "key-1"})
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="unsupported algorithm"):
+            await auth_service.verify_token(token)
+
+
+@pytest.mark.unit
+class TestCognitoAuthServiceUsers:
+    """Unit tests for Cognito user operations."""
+
+    @pytest.fixture
+    def auth_service(self):
+        """Create auth service with a mocked Cognito client."""
+        with patch("src.infrastructure.aws.cognito_auth.boto3.client") as client_factory:
+            service = CognitoAuthService(
+                user_pool_id="us-east-2_ABC123",
+                app_client_id="client123",
+            )
+        assert service._cognito_client is client_factory.return_value
+        return service
+
+    @pytest.mark.asyncio
+    async def test_authenticate_user_off_event_loop(self, auth_service):
+        """Test that the blocking Cognito call runs in a worker thread."""
+        # Arrange
+        loop_thread = threading.get_ident()
+        calls = []
+
+        def initiate_auth(**kwargs):
+            calls.append(threading.get_ident())
+            return {"AuthenticationResult": {"AccessToken": "access", "IdToken": "id"}}
+
+        auth_service._cognito_client.initiate_auth.side_effect = initiate_auth
+
+        # Act
+        tokens = await auth_service.authenticate_user("alice", "secret")
+
+        # Assert
+        assert tokens["access_token"] == "access"
+        assert calls and calls[0] != loop_thread
@@ -0,0 +1,94 @@
+"""Unit tests for FlashQueryRegistry."""
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.application.interfaces.agent_orchestrator import IAgentOrchestrator
+from src.domain.entities.query_result import AgentStep, QueryResult
+from src.infrastructure.agent.flash_queries import FlashQueryRegistry
+
+
+def _result(query: str, actions: tuple[str, ...] = ()) -> QueryResult:
+    """Build a QueryResult with the given tool actions."""
+    return QueryResult(
+        query=query,
+        answer="Amazon reported strong AWS growth.",
+        reasoning_steps=[
+            AgentStep(
+                step_number=idx,
+                action=action,
+                action_input={},
+                observation="",
+                timestamp=datetime.now(),
+            )
+            for idx, action in enumerate(actions, 1)
+        ],
+        sources=[],
+        execution_time_ms=3000.0,
+        timestamp=datetime.now(),
+    )
+
+
+@pytest.mark.unit
+class TestFlashQueryRegistry:
+    """Unit tests for FlashQueryRegistry."""
+
+    @pytest.fixture
+    def mock_orchestrator(self):
+        """Create mock inner orchestrator."""
+        mock = Mock(spec=IAgentOrchestrator)
+        mock.process_query = AsyncMock(side_effect=lambda query, user_id: _result(query))
+        return mock
+
+    @pytest.fixture
+    async def registry(self, mock_orchestrator):
+        """Create registry and stop its background task afterwards."""
+        registry = FlashQueryRegistry(orchestrator=mock_orchestrator, top_k=1)
+        yield registry
+        await registry.aclose()
+
+    @pytest.mark.asyncio
+    async def test_miss_delegates_to_orchestrator(self, registry, mock_orchestrator):
+        """Test that queries without a pre-evaluated answer are delegated."""
+        # Act
+        result = await registry.process_query("AWS growth?", "user-1")
+
+        # Assert
+        assert result.metadata is None
+        mock_orchestrator.process_query.assert_called_once_with("AWS growth?", "user-1")
+
+    @pytest.mark.asyncio
+    async def test_prefetched_query_served_from_memory(self, registry, mock_orchestrator):
+        """Test that a pre-evaluated frequent query skips the orchestrator."""
+        # Arrange
+        await registry.process_query("AWS growth?", "user-1")
+        await registry._prefetch("aws growth?")
+        mock_orchestrator.process_query.reset_mock()
+
+        # Act
+        result = await registry.process_query("  aws GROWTH? ", "user-2")
+
+        # Assert
+        assert result.metadata == {"cache_hit": True, "flash_query": True}
+        assert result.query == "  aws GROWTH? "
+        mock_orchestrator.process_query.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_realtime_answers_expire_quickly(self, mock_orchestrator):
+        """Test that answers built from realtime prices use the short TTL."""
+        # Arrange
+        mock_orchestrator.process_query = AsyncMock(
+            return_value=_result("AMZN price?", ("retrieve_realtime_stock_price",))
+        )
+        registry = FlashQueryRegistry(orchestrator=mock_orchestrator, realtime_ttl_seconds=0)
+        await registry.process_query("AMZN price?", "user-1")
+        await registry._prefetch("amzn price?")
+        mock_orchestrator.process_query.reset_mock()
+
+        # Act
+        await registry.process_query("AMZN price?", "user-1")
+        await registry.aclose()
+
+        # Assert
+        mock_orchestrator.process_query.assert_called_once()
@@ -0,0 +1,115 @@
+"""Unit tests for InMemorySemanticCache."""
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.domain.interfaces.llm_service import ILLMService
+from src.infrastructure.cache.semantic_cache import InMemorySemanticCache
+
+
+@pytest.mark.unit
+class TestInMemorySemanticCache:
+    """Unit tests for InMemorySemanticCache."""
+
+    @pytest.fixture
+    def mock_llm_service(self):
+        """Create mock LLM service with deterministic embeddings."""
+        embeddings = {
+            "amazon revenue 2024": [1.0, 0.0, 0.0],
+            "what was amazon revenue in 2024": [0.99, 0.05, 0.0],
+            "aws operating margin": [0.0, 1.0, 0.0],
+        }
+        mock = Mock(spec=ILLMService)
+        mock.embed_text = AsyncMock(side_effect=lambda text: embeddings[text.lower()])
+        return mock
+
+    @pytest.fixture
+    def cache(self, mock_llm_service):
+        """Create cache with mocked embeddings."""
+        return InMemorySemanticCache(llm_service=mock_llm_service)
+
+    @pytest.mark.asyncio
+    async def test_exact_repeat_skips_embedding(self, cache, mock_llm_service):
+        """Test that an exact repeat is served without another embedding call."""
+        # Arrange
+        await cache.set("docs", "Amazon revenue 2024", ["chunk"])
+        mock_llm_service.embed_text.reset_mock()
+
+        # Act
+        result = await cache.get("docs", "  amazon   REVENUE 2024 ")
+
+        # Assert
+        assert result == ["chunk"]
+        mock_llm_service.embed_text.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_paraphrase_hits_above_threshold(self, cache):
+        """Test that a semantically similar query returns the cached value."""
+        # Arrange
+        await cache.set("docs", "Amazon revenue 2024", ["chunk"])
+
+        # Act
+        result = await cache.get("docs", "What was Amazon revenue in 2024")
+
+        # Assert
+        assert result == ["chunk"]
+
+    @pytest.mark.asyncio
+    async def test_unrelated_query_misses(self, cache):
+        """Test that a dissimilar query is a cache miss."""
+        # Arrange
+        await cache.set("docs", "Amazon revenue 2024", ["chunk"])
+
+        # Act
+        result = await cache.get("docs", "AWS operating margin")
+
+        # Assert
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_namespaces_are_isolated(self, cache):
+        """Test that entries are not shared across namespaces."""
+        # Arrange
+        await cache.set("docs", "Amazon revenue 2024", ["chunk"])
+
+        # Act
+        result = await cache.get("agent", "Amazon revenue 2024")
+
+        # Assert
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_embedding_failure_bypasses_cache(self, cache, mock_llm_service):
+        """Test that embedding errors result in a miss instead of an exception."""
+        # Arrange
+        mock_llm_service.embed_text.side_effect = RuntimeError("Bedrock unavailable")
+
+        # Act
+        await cache.set("docs", "Amazon revenue 2024", ["chunk"])
+        result = await cache.get("docs", "Amazon revenue 2024")
+
+        # Assert
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self, mock_llm_service):
+        """Test that the oldest entry is evicted once max_entries is exceeded."""
+        # Arrange
+        cache = InMemorySemanticCache(llm_service=mock_llm_service, max_entries=1)
+        await cache.set("docs", "Amazon revenue 2024", ["first"])
+
+        # Act
+        await cache.set("docs", "AWS operating margin", ["second"])
+
+        # Assert
+        assert await cache.get("docs", "AWS operating margin") == ["second"]
+        assert await cache.get("docs", "Amazon revenue 2024") is None
+
+    def test_invalid_thresholds_raise_error(self, mock_llm_service):
+        """Test that inconsistent thresholds are rejected."""
+        with pytest.raises(ValueError, match="Similarity thresholds"):
+            InMemorySemanticCache(
+                llm_service=mock_llm_service,
+                similarity_threshold=0.8,
+                min_similarity_threshold=0.9,
+            )
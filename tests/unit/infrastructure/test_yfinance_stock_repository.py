@@ -0,0 +1,120 @@
+"""Unit tests for YFinanceStockRepository."""
+import asyncio
+import threading
+import time
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import Mock, patch
+
+import pandas as pd
+import pytest
+
+from src.infrastructure.repositories.yfinance_stock_repository import (
+    YFinanceStockRepository,
+)
+
+TICKER_PATH = "src.infrastructure.repositories.yfinance_stock_repository.yf.Ticker"
+
+
+@pytest.mark.unit
+class TestYFinanceStockRepository:
+    """Unit tests for YFinanceStockRepository."""
+
+    @pytest.mark.asyncio
+    async def test_realtime_price_passes_session_to_ticker(self):
+        """Test that the configured session is handed to yfinance."""
+        # Arrange
+        session = Mock()
+        repository = YFinanceStockRepository(session=session)
+
+        with patch(TICKER_PATH) as mock_ticker_cls:
+            mock_ticker_cls.return_value.info = {"currentPrice": 185.5, "currency": "USD"}
+
+            # Act
+            price = await repository.get_realtime_price("AMZN")
+
+        # Assert
+        mock_ticker_cls.assert_called_once_with("AMZN", session=session)
+        assert float(price.price) == 185.5
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_are_bounded(self):
+        """Test that no more than max_concurrency yfinance calls run at once."""
+        # Arrange
+        repository = YFinanceStockRepository(max_concurrency=2)
+        lock = threading.Lock()
+        active = 0
+        peak = 0
+
+        def fetch_info():
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+            return {"currentPrice": 100.0}
+
+        ticker = Mock()
+        type(ticker).info = property(lambda _: fetch_info())
+
+        with patch(TICKER_PATH, return_value=ticker):
+            # Act
+            await asyncio.gather(*(repository.get_realtime_price("AMZN") for _ in range(6)))
+
+        # Assert
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_historical_prices_are_built_from_dataframe_columns(self):
+        """Test that history rows map to StockPrice entities in order."""
+        # Arrange
+        repository = YFinanceStockRepository()
+        hist = pd.DataFrame(
+            {
+                "Open": [182.0, 186.0],
+                "High": [186.5, 190.0],
+                "Low": [181.0, 185.5],
+                "Close": [185.42, 189.1],
+                "Volume": [41_000_000, 39_500_000],
+            },
+            index=pd.DatetimeIndex([datetime(2024, 10, 1), datetime(2024, 10, 2)]),
+        )
+
+        with patch(TICKER_PATH) as mock_ticker_cls:
+            mock_ticker_cls.return_value.history.return_value = hist
+
+            # Act
+            result = await repository.get_historical_prices(
+                "AMZN", datetime(2024, 10, 1), datetime(2024, 10, 3)
+            )
+
+        # Assert
+        first, second = result.prices
+        assert first.timestamp == datetime(2024, 10, 1)
+        assert first.price == first.close_price == Decimal("185.42")
+        assert first.open_price == Decimal("182.0")
+        assert first.volume == 41_000_000
+        assert second.day_high == Decimal("190.0")
+        assert second.day_low == Decimal("185.5")
+
+    @pytest.mark.asyncio
+    async def test_realtime_price_converts_info_fields_to_decimal(self):
+        """Test that info floats keep their short form and missing fields become None."""
+        # Arrange
+        repository = YFinanceStockRepository()
+        info = {"currentPrice": 185.42, "dayHigh": 186.5, "dayLow": 0, "open": None}
+
+        with patch(TICKER_PATH) as mock_ticker_cls:
+            mock_ticker_cls.return_value.info = info
+
+            # Act
+            result = await repository.get_realtime_price("AMZN")
+
+        # Assert
+        assert str(result.price) == "185.42"
+        assert result.day_high == Decimal("186.5")
+        assert result.day_low is None
+        assert result.open_price is None
+        assert result.market_cap is None
@@ -0,0 +1,68 @@
+"""Unit tests for EventStreamFormatter."""
+import json
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from src.domain.entities.query_result import StreamEvent
+from src.presentation.streaming.event_stream import EventStreamFormatter
+
+
+@pytest.mark.unit
+class TestEventStreamFormatter:
+    """Unit tests for EventStreamFormatter."""
+
+    def test_format_event_produces_sse_frame(self):
+        """Test that events are serialized as a single SSE data frame."""
+        # Arrange
+        event = StreamEvent(
+            event_type="tool_call",
+            data={"tool": "retrieve_realtime_stock_price", "args": {"symbol": "AMZN"}},
+            timestamp=datetime(2024, 1, 2, 9, 30),
+        )
+
+        # Act
+        frame = EventStreamFormatter.format_event(event)
+
+        # Assert
+        assert frame.startswith(b"data: ")
+        assert frame.endswith(b"\n\n")
+        assert json.loads(frame[len(b"data: ") :]) == {
+            "event_type": "tool_call",
+            "data": {"tool": "retrieve_realtime_stock_price", "args": {"symbol": "AMZN"}},
+            "timestamp": "2024-01-02T09:30:00",
+        }
+
+    def test_format_event_serializes_non_json_values_as_strings(self):
+        """Test that values such as Decimal do not break serialization."""
+        # Arrange
+        event = StreamEvent(
+            event_type="final_answer",
+            data={"price": Decimal("185.50")},
+            timestamp=datetime(2024, 1, 2),
+        )
+
+        # Act
+        frame = EventStreamFormatter.format_event(event)
+
+        # Assert
+        assert json.loads(frame[len(b"data: ") :])["data"] == {"price": "185.50"}
+
+    @pytest.mark.asyncio
+    async def test_stream_events_emits_error_event_on_failure(self):
+        """Test that a failing event source ends with an error frame."""
+
+        # Arrange
+        async def failing_events():
+            raise RuntimeError("Bedrock throttled")
+            yield  # pragma: no cover
+
+        # Act
+        frames = [frame async for frame in EventStreamFormatter.stream_events(failing_events())]
+
+        # Assert
+        assert len(frames) == 1
+        payload = json.loads(frames[0][len(b"data: ") :])
+        assert payload["event_type"] == "error"
+        assert payload["data"] == {"error": "Bedrock throttled"}
@@ -0,0 +1,47 @@
+"""Unit tests for API response serialization."""
+from datetime import datetime
+from decimal import Decimal
+
+import orjson
+import pytest
+
+from src.domain.entities.query_result import AgentStep, QueryResult
+from src.presentation.api.schemas.response import QueryResponse, render_query_response
+
+
+@pytest.mark.unit
+class TestRenderQueryResponse:
+    """Unit tests for render_query_response."""
+
+    def test_rendered_body_matches_query_response_schema(self):
+        """Test that the rendered JSON validates as a QueryResponse."""
+        # Arrange
+        timestamp = datetime(2024, 10, 31, 16, 0)
+        result = QueryResult(
+            query="What is AMZN stock price?",
+            answer="AMZN is trading at $185.42",
+            reasoning_steps=[
+                AgentStep(
+                    step_number=1,
+                    action="retrieve_realtime_stock_price",
+                    action_input={"symbol": "AMZN", "limit": Decimal("1.5")},
+                    observation="",
+                    timestamp=timestamp,
+                )
+            ],
+            sources=["yfinance API"],
+            execution_time_ms=1234.5,
+            timestamp=timestamp,
+            trace_id="trace_123",
+            metadata={"cache_hit": True},
+        )
+
+        # Act
+        body = render_query_response(result)
+
+        # Assert
+        response = QueryResponse.model_validate_json(body)
+        assert response.reasoning_steps[0].action_input == {"symbol": "AMZN", "limit": "1.5"}
+        assert response.timestamp == timestamp
+        assert response.metadata == {"cache_hit": True}
+        assert orjson.loads(body)["trace_id"] == "trace_123"
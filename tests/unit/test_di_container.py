@@ -3,8 +3,10 @@ import os
 from unittest.mock import Mock, patch
 
 import pytest
+from pydantic import ValidationError
 
 from src.di.container import DIContainer
+from src.di.settings import Settings
 
 
 @pytest.mark.unit
@@ -35,8 +37,8 @@ class TestDIContainer:
         container = DIContainer()
 
         # Assert
-        assert container.aws_region == "us-west-2"
-        assert container.bedrock_model_id == "anthropic.claude-3-sonnet-20240229-v1:0"
+        assert container.settings.aws_region == "us-west-2"
+        assert container.settings.bedrock_model_id == "anthropic.claude-3-sonnet-20240229-v1:0"
         assert container.bedrock_kb_id == "kb-test-123"
 
     def test_container_uses_default_values_when_env_not_set(self, clean_env):
@@ -45,17 +47,64 @@ class TestDIContainer:
         container = DIContainer()
 
         # Assert
-        assert container.aws_region == "us-east-1"  # Default
-        assert container.observability_provider == "none"  # Default
+        assert container.settings.aws_region == "us-east-1"  # Default
+        assert container.settings.observability_provider == "none"  # Default
+
+    def test_container_accepts_explicit_settings(self, clean_env):
+        """Test that settings can be injected without touching the environment."""
+        # Arrange
+        settings = Settings(aws_region="eu-west-1", yfinance_max_concurrency=2)
+
+        # Act
+        container = DIContainer(settings=settings)
+
+        # Assert
+        assert container.settings is settings
+        assert container.stock_repository._repository._semaphore._value == 2
+
+    def test_settings_bedrock_regions_default_to_aws_region(self):
+        """Test that Bedrock regions fall back to AWS_REGION."""
+        # Act
+        settings = Settings.from_env({"AWS_REGION": "eu-west-1", "BEDROCK_LLM_REGION": "us-east-1"})
+
+        # Assert
+        assert settings.bedrock_region == "eu-west-1"
+        assert settings.bedrock_llm_region == "us-east-1"
+
+    def test_settings_reject_invalid_values(self):
+        """Test that malformed environment values fail fast."""
+        with pytest.raises(ValidationError):
+            Settings.from_env({"SEMANTIC_CACHE_MAX_ENTRIES": "lots"})
+
+        with pytest.raises(ValidationError):
+            Settings.from_env({"BEDROCK_PERFORMANCE_MODE": "turbo"})
 
     def test_stock_repository_returns_yfinance_repository(self, clean_env):
-        """Test that stock_repository returns YFinanceStockRepository."""
+        """Test that stock_repository returns a cached YFinanceStockRepository."""
         # Arrange
         container = DIContainer()
 
         # Act
         repo = container.stock_repository
 
+        # Assert
+        from src.infrastructure.repositories.cached_stock_repository import (
+            CachedStockRepository,
+        )
+        from src.infrastructure.repositories.yfinance_stock_repository import (
+            YFinanceStockRepository,
+        )
+        assert isinstance(repo, CachedStockRepository)
+        assert isinstance(repo._repository, YFinanceStockRepository)
+
+    def test_stock_repository_cache_can_be_disabled(self, clean_env):
+        """Test that a zero realtime price TTL returns the bare YFinanceStockRepository."""
+        # Arrange
+        container = DIContainer(settings=Settings(realtime_price_cache_ttl_seconds=0))
+
+        # Act
+        repo = container.stock_repository
+
         # Assert
         from src.infrastructure.repositories.yfinance_stock_repository import (
             YFinanceStockRepository,
@@ -74,9 +123,24 @@ class TestDIContainer:
         # Assert
         assert repo1 is repo2
 
+    def test_stock_price_use_cases_are_singletons(self, clean_env):
+        """Test that use case getters return the same instance on multiple calls."""
+        # Arrange
+        container = DIContainer()
+
+        # Act
+        realtime1 = container.get_realtime_stock_price_use_case()
+        realtime2 = container.get_realtime_stock_price_use_case()
+        historical1 = container.get_historical_stock_price_use_case()
+        historical2 = container.get_historical_stock_price_use_case()
+
+        # Assert
+        assert realtime1 is realtime2
+        assert historical1 is historical2
+
     @patch("boto3.client")
     def test_document_repository_returns_bedrock_repository(self, mock_boto_client, clean_env):
-        """Test that document_repository returns BedrockDocumentRepository."""
+        """Test that document_repository returns a coalescing BedrockDocumentRepository."""
         # Arrange
         os.environ["BEDROCK_KNOWLEDGE_BASE_ID"] = "kb-123"
         os.environ["BEDROCK_MODEL_ARN"] = "arn:aws:bedrock:us-east-1::foundation-model/anthropic.claude-3-sonnet-20240229-v1:0"
@@ -89,7 +153,26 @@ class TestDIContainer:
         from src.infrastructure.repositories.bedrock_document_repository import (
             BedrockDocumentRepository,
         )
-        assert isinstance(repo, BedrockDocumentRepository)
+        from src.infrastructure.repositories.coalescing_document_repository import (
+            CoalescingDocumentRepository,
+        )
+        assert isinstance(repo, CoalescingDocumentRepository)
+        assert isinstance(repo._repository, BedrockDocumentRepository)
+
+    def test_eager_init_builds_configured_document_repository(self, clean_env):
+        """Test that eager init creates the document repository when the KB is configured."""
+        # Arrange
+        os.environ["BEDROCK_KNOWLEDGE_BASE_ID"] = "kb-123"
+
+        # Act
+        with patch("src.di.container.BedrockDocumentRepository") as mock_repository_cls:
+            container = DIContainer(eager_init=True)
+
+        # Assert
+        mock_repository_cls.assert_called_once()
+        assert mock_repository_cls.call_args.kwargs["session"] is container._boto_session
+        assert container._document_repository is not None
+        assert container._cognito_service is None
 
     def test_observability_service_returns_none_when_provider_is_none(self, clean_env):
         """Test that observability_service returns None when provider is 'none'."""
@@ -275,5 +358,5 @@ class TestDIContainer:
         container = DIContainer()
 
         # Assert - Should still initialize with defaults
-        assert container.aws_region == "us-east-1"
-        assert container.observability_provider == "none"
+        assert container.settings.aws_region == "us-east-1"
+        assert container.settings.observability_provider == "none"